@@ -1,6 +1,32 @@
 """Configuration modules."""
 
-from .settings import Settings, Environment, get_settings
-from .logging_config import configure_logging, get_logger
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Resolved lazily at runtime (see __getattr__); imported here so type
+    # checkers still see the real exported types
+    from .logging_config import configure_logging, get_logger
+    from .settings import Environment, Settings, get_settings
 
 __all__ = ["Settings", "Environment", "get_settings", "configure_logging", "get_logger"]
+
+_LAZY_ATTRS = {
+    "Settings": ".settings",
+    "Environment": ".settings",
+    "get_settings": ".settings",
+    "configure_logging": ".logging_config",
+    "get_logger": ".logging_config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve exports on first access so importing a submodule stays cheap."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,10 +1,11 @@
 """Application settings using Pydantic Settings."""
 
 from enum import Enum
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional
 
-from pydantic import Field, field_validator
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -24,6 +25,7 @@ class Settings(BaseSettings):
 
     # Kalshi API
     kalshi_api_key_id: str = Field(..., description="Kalshi API key ID")
+    # Existence is checked when the key is loaded, not on every Settings() construction
     kalshi_private_key_path: Path = Field(..., description="Path to RSA private key PEM file")
     environment: Environment = Field(default=Environment.DEVELOPMENT)
 
@@ -48,21 +50,14 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO")
     log_format: str = Field(default="json")
 
-    @field_validator("kalshi_private_key_path")
-    @classmethod
-    def validate_key_path(cls, v: Path) -> Path:
-        if not v.exists():
-            raise ValueError(f"Private key file not found: {v}")
-        return v
-
-    @property
+    @cached_property
     def base_url(self) -> str:
         """Get the API base URL based on environment."""
         if self.environment == Environment.PRODUCTION:
             return "https://api.elections.kalshi.com/trade-api/v2"
         return "https://demo-api.kalshi.co/trade-api/v2"
 
-    @property
+    @cached_property
     def websocket_url(self) -> str:
         """Get the WebSocket URL based on environment."""
         if self.environment == Environment.PRODUCTION:
@@ -70,6 +65,11 @@ class Settings(BaseSettings):
         return "wss://demo-api.kalshi.co/trade-api/v2/ws"
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get cached settings instance."""
+    """Get cached settings instance.
+
+    Settings are constructed once per process; call ``get_settings.cache_clear()``
+    to force a reload (e.g. after changing environment variables in tests).
+    """
     return Settings()
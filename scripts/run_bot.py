@@ -11,7 +11,8 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from config.logging_config import configure_logging, get_logger
-from config.settings import Settings, Environment
+from config.settings import get_settings
+from src.core.eventloop import run
 
 
 async def run_bot(
@@ -25,7 +26,7 @@ async def run_bot(
         paper_trading: If True, log trades but don't execute
     """
     # Load settings
-    settings = Settings()
+    settings = get_settings()
 
     # Configure logging
     configure_logging(
@@ -133,7 +134,7 @@ Examples:
     os.environ["LOG_LEVEL"] = args.log_level
 
     # Run the bot
-    asyncio.run(run_bot(args.events, args.paper))
+    run(run_bot(args.events, args.paper))
 
 
 if __name__ == "__main__":
@@ -2,128 +2,125 @@
 """Scan Kalshi markets for arbitrage opportunities."""
 
 import asyncio
+import heapq
 import sys
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from config.settings import Settings
 from config.logging_config import configure_logging, get_logger
-from src.core.authenticator import KalshiAuthenticator
-from src.core.client import KalshiClient
-from src.data.market_fetcher import MarketFetcher
-from src.data.orderbook_manager import OrderbookManager
-from src.arbitrage.detector import ArbitrageDetector
+from src.core.client import shared_client
+from src.core.eventloop import run
 
 
 async def scan_for_arbitrage():
     """Scan markets for arbitrage opportunities."""
+    # Import here so startup only pays for the data/arbitrage layers when scanning
+    from src.arbitrage.detector import ArbitrageDetector
+    from src.data.market_fetcher import MarketFetcher
+    from src.data.orderbook_manager import OrderbookManager
+
     configure_logging(log_level="INFO", log_format="console")
     logger = get_logger(__name__)
 
-    settings = Settings()
-
-    auth = KalshiAuthenticator(
-        api_key_id=settings.kalshi_api_key_id,
-        private_key_path=settings.kalshi_private_key_path,
-    )
-
-    async with KalshiClient(
-        base_url=settings.base_url,
-        authenticator=auth,
-    ) as client:
+    async with shared_client() as client:
         fetcher = MarketFetcher(client)
         orderbook_mgr = OrderbookManager()
         detector = ArbitrageDetector(min_profit_cents=1)  # Low threshold to find more
 
         # Fetch all open markets
+        # Group by event as pages arrive rather than materializing every market.
+        # The next page is requested before the current one is grouped so the
+        # fetch overlaps with local processing.
         print("Fetching all open markets...")
-        all_markets = []
-        cursor = None
+        events = {}
+        total_markets = 0
+        response = await client.get_markets(status="open", limit=100)
 
         while True:
-            response = await client.get_markets(status="open", limit=100, cursor=cursor)
             markets = response.get("markets", [])
-            all_markets.extend(markets)
             cursor = response.get("cursor")
-            if not cursor or len(markets) < 100:
-                break
+            next_page = None
+            if cursor and len(markets) >= 100:
+                next_page = asyncio.create_task(
+                    client.get_markets(status="open", limit=100, cursor=cursor)
+                )
 
-        print(f"Found {len(all_markets)} total open markets")
+            total_markets += len(markets)
+            for m in markets:
+                event_ticker = m.get("event_ticker", "")
+                if event_ticker:
+                    events.setdefault(event_ticker, []).append(m)
 
-        # Group by event
-        events = {}
-        for m in all_markets:
-            event_ticker = m.get("event_ticker", "")
-            if event_ticker:
-                events.setdefault(event_ticker, []).append(m)
+            if next_page is None:
+                break
+            response = await next_page
+
+        print(f"Found {total_markets} total open markets")
 
         # Filter to multi-outcome events with prices
         candidates = {}
         for event_ticker, markets in events.items():
             if len(markets) >= 2:
-                # Check if any have actual prices
-                has_prices = any(m.get("yes_ask") for m in markets)
-                if has_prices:
+                # Require two priced markets, stopping the scan once both are seen
+                priced = (m for m in markets if m.get("yes_ask"))
+                if next(priced, None) and next(priced, None):
                     candidates[event_ticker] = markets
 
-        print(f"Found {len(candidates)} events with 2+ markets and liquidity")
+        print(f"Found {len(candidates)} events with 2+ priced markets")
         print("\n" + "="*70)
 
         # Analyze each candidate event
         opportunities_found = []
 
-        for event_ticker, markets in sorted(candidates.items(), key=lambda x: -len(x[1]))[:20]:
-            # Calculate sum of YES asks
-            total_yes_ask = 0
-            market_details = []
-            all_have_prices = True
-
+        top_events = heapq.nlargest(20, candidates.items(), key=lambda x: len(x[1]))
+        for event_ticker, markets in top_events:
+            # Project the YES asks once, abandoning the event at the first
+            # market without a price
+            yes_asks = []
             for m in markets:
-                yes_ask = m.get("yes_ask")
-                if yes_ask and yes_ask > 0:
-                    total_yes_ask += yes_ask
-                    market_details.append({
-                        "ticker": m.get("ticker"),
-                        "title": m.get("title", "")[:45],
-                        "yes_ask": yes_ask,
-                        "yes_bid": m.get("yes_bid", 0),
-                    })
-                else:
-                    all_have_prices = False
-
-            if not all_have_prices or not market_details:
+                yes_ask = m.get("yes_ask") or 0
+                if yes_ask <= 0:
+                    break
+                yes_asks.append(yes_ask)
+            if len(yes_asks) < len(markets):
                 continue
+            total_yes_ask = sum(yes_asks)
 
             # Check for arbitrage
             profit = 100 - total_yes_ask
             is_arb = profit > 0
 
-            print(f"\nEvent: {event_ticker}")
-            print(f"Markets: {len(markets)}, With prices: {len(market_details)}")
-
-            for md in market_details[:8]:
-                prefix = "  "
-                print(f"{prefix}{md['yes_ask']:2d}¢ ask | {md['yes_bid']:2d}¢ bid | {md['title']}")
-
-            if len(market_details) > 8:
-                print(f"  ... and {len(market_details) - 8} more markets")
-
-            if len(market_details) == len(markets):
-                print(f"  TOTAL YES ASK: {total_yes_ask}¢", end="")
-                if is_arb:
-                    print(f" *** ARBITRAGE: {profit}¢ profit ***")
-                    opportunities_found.append({
-                        "event": event_ticker,
-                        "profit": profit,
-                        "markets": len(markets),
-                        "total_cost": total_yes_ask,
-                    })
-                else:
-                    print(f" (no arb, {-profit}¢ over)")
+            # Build the event's block and emit it with a single print
+            lines = [
+                f"\nEvent: {event_ticker}",
+                f"Markets: {len(markets)}, With prices: {len(yes_asks)}",
+            ]
+
+            # Only the markets actually printed need their details looked up
+            for m, yes_ask in zip(markets[:8], yes_asks):
+                yes_bid = m.get("yes_bid", 0)
+                title = m.get("title", "")[:45]
+                lines.append(f"  {yes_ask:2d}¢ ask | {yes_bid:2d}¢ bid | {title}")
+
+            if len(markets) > 8:
+                lines.append(f"  ... and {len(markets) - 8} more markets")
+
+            if is_arb:
+                lines.append(
+                    f"  TOTAL YES ASK: {total_yes_ask}¢ *** ARBITRAGE: {profit}¢ profit ***"
+                )
+                opportunities_found.append({
+                    "event": event_ticker,
+                    "profit": profit,
+                    "markets": len(markets),
+                    "total_cost": total_yes_ask,
+                })
             else:
-                print(f"  Partial prices: {total_yes_ask}¢ for {len(market_details)}/{len(markets)} markets")
+                lines.append(f"  TOTAL YES ASK: {total_yes_ask}¢ (no arb, {-profit}¢ over)")
+
+            print("\n".join(lines))
 
         print("\n" + "="*70)
         print("ARBITRAGE SUMMARY")
@@ -131,9 +128,11 @@ async def scan_for_arbitrage():
 
         if opportunities_found:
             print(f"\nFound {len(opportunities_found)} arbitrage opportunities:\n")
-            for opp in sorted(opportunities_found, key=lambda x: -x["profit"]):
-                print(f"  {opp['event']}")
-                print(f"    Profit: {opp['profit']}¢ | Cost: {opp['total_cost']}¢ | Markets: {opp['markets']}")
+            print("\n".join(
+                f"  {opp['event']}\n"
+                f"    Profit: {opp['profit']}¢ | Cost: {opp['total_cost']}¢ | Markets: {opp['markets']}"
+                for opp in sorted(opportunities_found, key=lambda x: -x["profit"])
+            ))
         else:
             print("\nNo arbitrage opportunities found at this time.")
             print("This is expected - markets are generally efficient.")
@@ -141,4 +140,4 @@ async def scan_for_arbitrage():
 
 
 if __name__ == "__main__":
-    asyncio.run(scan_for_arbitrage())
+    run(scan_for_arbitrage())
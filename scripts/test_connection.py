@@ -3,16 +3,17 @@
 
 import asyncio
 import sys
+from itertools import islice
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from config.settings import Settings
+from config.settings import get_settings
 from config.logging_config import configure_logging, get_logger
-from src.core.authenticator import KalshiAuthenticator
-from src.core.client import KalshiClient
+from src.core.client import shared_client
+from src.core.eventloop import run
 
 
 async def test_connection():
@@ -21,23 +22,19 @@ async def test_connection():
     logger = get_logger(__name__)
 
     try:
-        settings = Settings()
+        settings = get_settings()
         logger.info(f"Environment: {settings.environment.value}")
         logger.info(f"Base URL: {settings.base_url}")
 
-        # Create authenticator and client
-        auth = KalshiAuthenticator(
-            api_key_id=settings.kalshi_api_key_id,
-            private_key_path=settings.kalshi_private_key_path,
-        )
-
-        async with KalshiClient(
-            base_url=settings.base_url,
-            authenticator=auth,
-        ) as client:
-            # Test 1: Get markets
+        # Create (or reuse) the shared API client
+        async with shared_client() as client:
+            # Test 1: Get markets (the larger page for Test 3 is fetched
+            # concurrently so both round trips overlap)
             logger.info("Fetching open markets...")
-            response = await client.get_markets(status="open", limit=10)
+            response, all_markets = await asyncio.gather(
+                client.get_markets(status="open", limit=10),
+                client.get_markets(status="open", limit=100),
+            )
             markets = response.get("markets", [])
 
             print(f"\n{'='*60}")
@@ -49,9 +46,7 @@ async def test_connection():
                 title = market.get("title", "")[:50]
                 yes_bid = market.get("yes_bid", "-")
                 yes_ask = market.get("yes_ask", "-")
-                print(f"\n{ticker}")
-                print(f"  {title}...")
-                print(f"  YES: {yes_bid}¢ / {yes_ask}¢")
+                print(f"\n{ticker}\n  {title}...\n  YES: {yes_bid}¢ / {yes_ask}¢")
 
             # Test 2: Get a specific orderbook
             if markets:
@@ -71,34 +66,37 @@ async def test_connection():
 
             # Group markets by event
             events = {}
-            all_markets = await client.get_markets(status="open", limit=100)
             for m in all_markets.get("markets", []):
                 event_ticker = m.get("event_ticker", "")
                 if event_ticker:
                     events.setdefault(event_ticker, []).append(m)
 
-            # Find events with 3+ markets
-            multi_outcome = {k: v for k, v in events.items() if len(v) >= 3}
+            # Find events with 3+ markets (only the first 5 are shown, so stop there)
+            multi_outcome = islice(
+                ((k, v) for k, v in events.items() if len(v) >= 3),
+                5,
+            )
 
             print(f"\n{'='*60}")
             print(f"Multi-outcome events (3+ markets) - Arbitrage candidates")
             print('='*60)
 
-            for event_ticker, event_markets in list(multi_outcome.items())[:5]:
-                print(f"\n{event_ticker} ({len(event_markets)} markets)")
+            for event_ticker, event_markets in multi_outcome:
+                lines = [f"\n{event_ticker} ({len(event_markets)} markets)"]
                 total_yes_ask = 0
                 for m in event_markets[:6]:
                     yes_ask = m.get("yes_ask")
                     title = m.get("title", "")[:40]
                     if yes_ask:
                         total_yes_ask += yes_ask
-                        print(f"  {yes_ask:2d}¢ - {title}")
+                        lines.append(f"  {yes_ask:2d}¢ - {title}")
                     else:
-                        print(f"  --¢ - {title}")
+                        lines.append(f"  --¢ - {title}")
                 if len(event_markets) > 6:
-                    print(f"  ... and {len(event_markets) - 6} more")
+                    lines.append(f"  ... and {len(event_markets) - 6} more")
                 if total_yes_ask > 0:
-                    print(f"  TOTAL: {total_yes_ask}¢ (arb if < 100¢)")
+                    lines.append(f"  TOTAL: {total_yes_ask}¢ (arb if < 100¢)")
+                print("\n".join(lines))
 
             print(f"\n{'='*60}")
             print("Connection test successful!")
@@ -110,4 +108,4 @@ async def test_connection():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_connection())
+    run(test_connection())
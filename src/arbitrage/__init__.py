@@ -1,6 +1,6 @@
 """Arbitrage detection modules."""
 
 from .detector import ArbitrageDetector
-from .calculator import ProfitCalculator
+from .calculator import ProfitCalculator, ProfitSummary
 
-__all__ = ["ArbitrageDetector", "ProfitCalculator"]
+__all__ = ["ArbitrageDetector", "ProfitCalculator", "ProfitSummary"]
@@ -1,6 +1,7 @@
 """Profit and fee calculations for arbitrage opportunities."""
 
-from decimal import Decimal, ROUND_UP
+from dataclasses import asdict, dataclass
+from decimal import Decimal
 from typing import Optional
 
 from config.logging_config import get_logger
@@ -9,6 +10,19 @@ from src.data.models import ArbitrageLeg, OrderAction
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class ProfitSummary:
+    """Profit metrics for a set of arbitrage legs."""
+
+    total_cost_cents: int
+    guaranteed_return_cents: int
+    gross_profit_cents: int
+    estimated_fees_cents: int
+    net_profit_cents: int
+    profit_margin_pct: float
+    is_profitable: bool
+
+
 class ProfitCalculator:
     """Calculates profits, fees, and costs for arbitrage trades.
 
@@ -31,6 +45,8 @@ class ProfitCalculator:
             fee_rate: Override fee rate (default 0.7%)
         """
         self.fee_rate = fee_rate or self.FEE_RATE
+        # Exact ratio of the fee rate so fees round up with integer math
+        self._fee_num, self._fee_den = self.fee_rate.as_integer_ratio()
 
     def calculate_leg_cost(self, leg: ArbitrageLeg) -> int:
         """Calculate cost for a single leg in cents.
@@ -41,7 +57,7 @@ class ProfitCalculator:
         Returns:
             Cost in cents (positive for buys)
         """
-        if leg.action == OrderAction.BUY:
+        if leg.action is OrderAction.BUY:
             return leg.price * leg.quantity
         else:
             # Selling receives premium
@@ -56,7 +72,12 @@ class ProfitCalculator:
         Returns:
             Total cost in cents
         """
-        return sum(self.calculate_leg_cost(leg) for leg in legs)
+        # Inlined calculate_leg_cost to avoid a method call per leg
+        buy = OrderAction.BUY
+        return sum(
+            leg.price * leg.quantity if leg.action is buy else -leg.price * leg.quantity
+            for leg in legs
+        )
 
     def calculate_fee_per_contract(self, price: int) -> int:
         """Calculate fee for a single contract at given price.
@@ -70,9 +91,11 @@ class ProfitCalculator:
         Returns:
             Fee in cents (rounded up)
         """
-        potential_profit = self.PAYOUT_CENTS - price
-        fee = Decimal(potential_profit) * self.fee_rate
-        return int(fee.quantize(Decimal("1"), rounding=ROUND_UP))
+        return self._fee_on(self.PAYOUT_CENTS - price)
+
+    def _fee_on(self, profit_cents: int) -> int:
+        """Fee on a profit amount in cents, rounded up to a whole cent."""
+        return -(-profit_cents * self._fee_num // self._fee_den)
 
     def calculate_total_fees(self, legs: list[ArbitrageLeg]) -> int:
         """Calculate total fees for arbitrage trade.
@@ -87,19 +110,39 @@ class ProfitCalculator:
             Total estimated fees in cents
         """
         # For each leg, calculate fee if that leg wins
-        # Use max fee as conservative estimate
-        max_fee = 0
+        # Use max fee as conservative estimate. The fee only grows with the
+        # profit, so round once on the largest winning-leg profit.
+        buy = OrderAction.BUY
+        payout = self.PAYOUT_CENTS
+        max_profit = 0
         for leg in legs:
-            if leg.action == OrderAction.BUY:
-                potential_profit = self.PAYOUT_CENTS - leg.price
-                fee = int(
-                    (Decimal(potential_profit) * self.fee_rate * leg.quantity).quantize(
-                        Decimal("1"), rounding=ROUND_UP
-                    )
-                )
-                max_fee = max(max_fee, fee)
+            if leg.action is buy:
+                potential_profit = (payout - leg.price) * leg.quantity
+                if potential_profit > max_profit:
+                    max_profit = potential_profit
 
-        return max_fee
+        return self._fee_on(max_profit)
+
+    def calculate_fees_for_prices(
+        self,
+        prices: list[int],
+        quantity: int = 1,
+    ) -> int:
+        """Calculate total fees for BUY legs given only their prices.
+
+        Same result as calculate_total_fees for YES buys that share one
+        quantity, without needing ArbitrageLeg objects.
+
+        Args:
+            prices: Acquisition price of each leg in cents
+            quantity: Contracts per leg
+
+        Returns:
+            Total estimated fees in cents
+        """
+        if not prices:
+            return 0
+        return self._fee_on((self.PAYOUT_CENTS - min(prices)) * quantity)
 
     def calculate_gross_profit(
         self,
@@ -131,10 +174,29 @@ class ProfitCalculator:
         Returns:
             Net profit in cents
         """
-        total_cost = self.calculate_total_cost(legs)
-        gross_profit = self.calculate_gross_profit(total_cost, guaranteed_return)
-        fees = self.calculate_total_fees(legs)
-        return gross_profit - fees
+        total_cost, fees = self._cost_and_fees(legs)
+        return guaranteed_return - total_cost - fees
+
+    def _cost_and_fees(self, legs: list[ArbitrageLeg]) -> tuple[int, int]:
+        """Compute total cost and total fees in a single pass over the legs.
+
+        Equivalent to (calculate_total_cost(legs), calculate_total_fees(legs)).
+        """
+        buy = OrderAction.BUY
+        payout = self.PAYOUT_CENTS
+        total_cost = 0
+        max_profit = 0
+        for leg in legs:
+            price = leg.price
+            quantity = leg.quantity
+            if leg.action is buy:
+                total_cost += price * quantity
+                profit = (payout - price) * quantity
+                if profit > max_profit:
+                    max_profit = profit
+            else:
+                total_cost -= price * quantity
+        return total_cost, self._fee_on(max_profit)
 
     def calculate_max_quantity(
         self,
@@ -152,12 +214,10 @@ class ProfitCalculator:
         Returns:
             Maximum tradeable quantity
         """
-        quantities = []
-        for leg in legs:
-            available = orderbook_quantities.get(leg.ticker, 0)
-            quantities.append(available)
-
-        return min(quantities) if quantities else 0
+        return min(
+            (orderbook_quantities.get(leg.ticker, 0) for leg in legs),
+            default=0,
+        )
 
     def calculate_break_even_cost(
         self,
@@ -173,19 +233,27 @@ class ProfitCalculator:
         Returns:
             Maximum cost that still yields profit
         """
-        # Approximate: cost + max_fee = return
-        # max_fee ≈ 0.7% * (return - avg_cost_per_leg)
-        # Iterative approximation
-        for cost in range(guaranteed_return - 1, 0, -1):
-            avg_price = cost // num_legs
-            max_profit = guaranteed_return - avg_price
-            max_fee = int(
-                Decimal(max_profit) * self.fee_rate * Decimal("1.5")  # Safety margin
-            )
-            if cost + max_fee < guaranteed_return:
-                return cost
-
-        return guaranteed_return - 1
+        # Approximate: cost + max_fee < return
+        # max_fee ≈ 0.7% * 1.5 (safety margin) * (return - avg_cost_per_leg)
+        r = guaranteed_return
+        num = self._fee_num * 3
+        den = self._fee_den * 2
+
+        def fits(cost: int) -> bool:
+            max_fee = (r - cost // num_legs) * num // den
+            return cost + max_fee < r
+
+        # Solve cost + k * (r - cost / n) < r for cost ignoring the integer
+        # floors, then nudge to the exact boundary (cost + max_fee is
+        # non-decreasing in cost, so only a step or two is ever needed)
+        cost = r * (den - num) * num_legs // (den * num_legs - num)
+        cost = max(1, min(cost, r - 1))
+        while cost < r - 1 and fits(cost + 1):
+            cost += 1
+        while cost > 1 and not fits(cost):
+            cost -= 1
+
+        return cost if fits(cost) else r - 1
 
     def is_profitable(
         self,
@@ -201,7 +269,25 @@ class ProfitCalculator:
         Returns:
             True if net profit >= min_profit_cents
         """
-        return self.calculate_net_profit(legs) >= min_profit_cents
+        _, ok = self.compute_profitability(legs, min_profit_cents)
+        return ok
+
+    def compute_profitability(
+        self,
+        legs: list[ArbitrageLeg],
+        min_profit_cents: int = 1,
+    ) -> tuple[int, bool]:
+        """Calculate net profit and profitability together.
+
+        Args:
+            legs: List of arbitrage legs
+            min_profit_cents: Minimum required profit
+
+        Returns:
+            Tuple of (net profit in cents, whether it meets min_profit_cents)
+        """
+        net_profit = self.calculate_net_profit(legs)
+        return net_profit, net_profit >= min_profit_cents
 
     def profit_summary(
         self,
@@ -217,19 +303,34 @@ class ProfitCalculator:
         Returns:
             Dict with all profit metrics
         """
-        total_cost = self.calculate_total_cost(legs)
-        gross_profit = self.calculate_gross_profit(total_cost, guaranteed_return)
-        fees = self.calculate_total_fees(legs)
+        return asdict(self.profit_summary_obj(legs, guaranteed_return))
+
+    def profit_summary_obj(
+        self,
+        legs: list[ArbitrageLeg],
+        guaranteed_return: int = PAYOUT_CENTS,
+    ) -> ProfitSummary:
+        """Get complete profit summary without building a dict.
+
+        Args:
+            legs: List of arbitrage legs
+            guaranteed_return: Guaranteed payout
+
+        Returns:
+            ProfitSummary with all profit metrics
+        """
+        total_cost, fees = self._cost_and_fees(legs)
+        gross_profit = guaranteed_return - total_cost
         net_profit = gross_profit - fees
 
-        return {
-            "total_cost_cents": total_cost,
-            "guaranteed_return_cents": guaranteed_return,
-            "gross_profit_cents": gross_profit,
-            "estimated_fees_cents": fees,
-            "net_profit_cents": net_profit,
-            "profit_margin_pct": (
+        return ProfitSummary(
+            total_cost_cents=total_cost,
+            guaranteed_return_cents=guaranteed_return,
+            gross_profit_cents=gross_profit,
+            estimated_fees_cents=fees,
+            net_profit_cents=net_profit,
+            profit_margin_pct=(
                 (net_profit / total_cost * 100) if total_cost > 0 else 0
             ),
-            "is_profitable": net_profit > 0,
-        }
+            is_profitable=net_profit > 0,
+        )
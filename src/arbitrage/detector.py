@@ -1,15 +1,24 @@
 """Main arbitrage detection coordinator."""
 
+import time
 from typing import Optional
 
 from config.logging_config import get_logger
-from src.data.models import ArbitrageOpportunity, Market, Orderbook
-from .strategies.correlated import CorrelatedStrategy
+from src.data.models import ArbitrageOpportunity, ArbitrageType, Market, Orderbook
+from .calculator import ProfitCalculator
+from .strategies.correlated import CorrelatedStrategy, CorrelationType
 from .strategies.multioutcome import MultiOutcomeStrategy
 from .strategies.time_based import TimeBasedStrategy
 
 logger = get_logger(__name__)
 
+# Strategy key responsible for each opportunity type
+_TYPE_TO_STRATEGY: dict[ArbitrageType, str] = {
+    ArbitrageType.MULTI_OUTCOME: "multioutcome",
+    ArbitrageType.TIME_BASED: "time_based",
+    ArbitrageType.CORRELATED: "correlated",
+}
+
 
 class ArbitrageDetector:
     """Coordinates multiple arbitrage detection strategies.
@@ -26,6 +35,7 @@ class ArbitrageDetector:
         enable_multioutcome: bool = True,
         enable_time_based: bool = True,
         enable_correlated: bool = True,
+        calculator: Optional[ProfitCalculator] = None,
     ) -> None:
         """Initialize arbitrage detector.
 
@@ -34,24 +44,29 @@ class ArbitrageDetector:
             enable_multioutcome: Enable multi-outcome strategy
             enable_time_based: Enable time-based strategy
             enable_correlated: Enable correlated events strategy
+            calculator: Profit calculator shared by all strategies
         """
         self.min_profit_cents = min_profit_cents
+        self.calculator = calculator or ProfitCalculator()
 
         self.strategies: dict = {}
 
         if enable_multioutcome:
             self.strategies["multioutcome"] = MultiOutcomeStrategy(
-                min_profit_cents=min_profit_cents
+                min_profit_cents=min_profit_cents,
+                calculator=self.calculator,
             )
 
         if enable_time_based:
             self.strategies["time_based"] = TimeBasedStrategy(
-                min_profit_cents=min_profit_cents
+                min_profit_cents=min_profit_cents,
+                calculator=self.calculator,
             )
 
         if enable_correlated:
             self.strategies["correlated"] = CorrelatedStrategy(
-                min_profit_cents=min_profit_cents
+                min_profit_cents=min_profit_cents,
+                calculator=self.calculator,
             )
 
         logger.info(
@@ -81,15 +96,18 @@ class ArbitrageDetector:
         if not markets or not orderbooks:
             return opportunities
 
+        # One timestamp for everything found in this scan
+        detected_at = time.time_ns()
+
         # Multi-outcome strategy
         if "multioutcome" in self.strategies:
-            opp = self._scan_multioutcome(markets, orderbooks)
+            opp = self._scan_multioutcome(markets, orderbooks, detected_at)
             if opp:
                 opportunities.append(opp)
 
         # Time-based strategy
         if "time_based" in self.strategies:
-            opps = self._scan_time_based(markets, orderbooks)
+            opps = self._scan_time_based(markets, orderbooks, detected_at)
             opportunities.extend(opps)
 
         # Log results
@@ -118,6 +136,29 @@ class ArbitrageDetector:
             orderbook_a: Orderbook for first market
             orderbook_b: Orderbook for second market
 
+        Returns:
+            List of detected opportunities
+        """
+        return self.scan_market_pairs(
+            [(market_a, market_b)],
+            {market_a.ticker: orderbook_a, market_b.ticker: orderbook_b},
+        )
+
+    def scan_market_pairs(
+        self,
+        pairs: list[tuple[Market, Market]],
+        orderbooks: dict[str, Orderbook],
+    ) -> list[ArbitrageOpportunity]:
+        """Scan many market pairs for correlated arbitrage.
+
+        Pairs are grouped by their matching correlation rule so each group
+        goes through the strategy's batch scan; pairs without a rule are
+        skipped.
+
+        Args:
+            pairs: (market_a, market_b) pairs to check
+            orderbooks: Current orderbook state for each market
+
         Returns:
             List of detected opportunities
         """
@@ -128,28 +169,36 @@ class ArbitrageDetector:
 
         strategy: CorrelatedStrategy = self.strategies["correlated"]
 
-        # Check for correlation rule match
-        rule = strategy.match_rule(market_a, market_b)
-        if rule:
-            from .strategies.correlated import CorrelationType
-
+        implies: list[tuple[Market, Market]] = []
+        excludes: list[tuple[Market, Market]] = []
+        equivalent: list[tuple[Market, Market]] = []
+        for market_a, market_b in pairs:
+            rule = strategy.match_rule(market_a, market_b)
+            if rule is None:
+                continue
             if rule.correlation == CorrelationType.IMPLIES:
-                opp = strategy.detect_implies(
-                    market_a, market_b, orderbook_a, orderbook_b
-                )
-                if opp:
-                    opportunities.append(opp)
-
+                implies.append((market_a, market_b))
             elif rule.correlation == CorrelationType.EXCLUDES:
-                opp = strategy.detect_excludes(
-                    market_a, market_b, orderbook_a, orderbook_b
-                )
-                if opp:
-                    opportunities.append(opp)
-
+                excludes.append((market_a, market_b))
             elif rule.correlation == CorrelationType.EQUIVALENT:
+                equivalent.append((market_a, market_b))
+
+        if implies:
+            opportunities.extend(strategy.scan_implies(implies, orderbooks))
+        if excludes:
+            opportunities.extend(strategy.scan_excludes(excludes, orderbooks))
+
+        detected_at = time.time_ns()
+        for market_a, market_b in equivalent:
+            orderbook_a = orderbooks.get(market_a.ticker)
+            orderbook_b = orderbooks.get(market_b.ticker)
+            if orderbook_a and orderbook_b:
                 opp = strategy.detect_equivalent(
-                    market_a, market_b, orderbook_a, orderbook_b
+                    market_a,
+                    market_b,
+                    orderbook_a,
+                    orderbook_b,
+                    detected_at=detected_at,
                 )
                 if opp:
                     opportunities.append(opp)
@@ -160,33 +209,21 @@ class ArbitrageDetector:
         self,
         markets: list[Market],
         orderbooks: dict[str, Orderbook],
+        detected_at: Optional[int] = None,
     ) -> Optional[ArbitrageOpportunity]:
         """Scan for multi-outcome arbitrage."""
         strategy: MultiOutcomeStrategy = self.strategies["multioutcome"]
-        return strategy.detect(markets, orderbooks)
+        return strategy.detect(markets, orderbooks, detected_at=detected_at)
 
     def _scan_time_based(
         self,
         markets: list[Market],
         orderbooks: dict[str, Orderbook],
+        detected_at: Optional[int] = None,
     ) -> list[ArbitrageOpportunity]:
         """Scan for time-based arbitrage."""
-        opportunities: list[ArbitrageOpportunity] = []
         strategy: TimeBasedStrategy = self.strategies["time_based"]
-
-        # Find temporal pairs
-        pairs = strategy.find_temporal_pairs(markets)
-
-        for earlier, later in pairs:
-            earlier_ob = orderbooks.get(earlier.ticker)
-            later_ob = orderbooks.get(later.ticker)
-
-            if earlier_ob and later_ob:
-                opp = strategy.detect(earlier, later, earlier_ob, later_ob)
-                if opp:
-                    opportunities.append(opp)
-
-        return opportunities
+        return strategy.detect_event(markets, orderbooks, detected_at=detected_at)
 
     def validate_opportunity(
         self,
@@ -204,11 +241,7 @@ class ArbitrageDetector:
         Returns:
             True if opportunity is still valid
         """
-        strategy_name = {
-            "multi_outcome": "multioutcome",
-            "time_based": "time_based",
-            "correlated": "correlated",
-        }.get(opportunity.type.value)
+        strategy_name = _TYPE_TO_STRATEGY.get(opportunity.type)
 
         if strategy_name not in self.strategies:
             return False
@@ -233,23 +266,19 @@ class ArbitrageDetector:
         Returns:
             Best opportunity or None
         """
-        if not opportunities:
-            return None
-
-        # Filter to profitable only
-        profitable = [o for o in opportunities if o.is_profitable]
-        if not profitable:
-            return None
-
-        # Sort by composite score
-        def score(opp: ArbitrageOpportunity) -> float:
+        # Single pass: unprofitable opportunities always rank below profitable
+        # ones, so the max is only unprofitable if nothing was profitable
+        def score(opp: ArbitrageOpportunity) -> tuple[bool, float]:
+            net_profit = opp.net_profit_cents
             return (
-                opp.net_profit_cents * 100
-                + opp.confidence * 10
-                + opp.max_quantity
+                net_profit > 0,
+                net_profit * 100 + opp.confidence * 10 + opp.max_quantity,
             )
 
-        return max(profitable, key=score)
+        best = max(opportunities, key=score, default=None)
+        if best is None or not best.is_profitable:
+            return None
+        return best
 
     @property
     def enabled_strategies(self) -> list[str]:
@@ -3,10 +3,12 @@
 Detects opportunities when related events violate logical constraints.
 """
 
-import uuid
+import fnmatch
+import re
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 from config.logging_config import get_logger
@@ -19,6 +21,7 @@ from src.data.models import (
     Orderbook,
     OrderAction,
     OrderSide,
+    new_opportunity_id,
 )
 
 logger = get_logger(__name__)
@@ -82,16 +85,42 @@ class CorrelatedStrategy:
         self,
         min_profit_cents: int = 2,
         rules: Optional[list[CorrelationRule]] = None,
+        calculator: Optional[ProfitCalculator] = None,
     ) -> None:
         """Initialize correlated strategy.
 
         Args:
             min_profit_cents: Minimum net profit to report
             rules: Correlation rules (uses defaults if not provided)
+            calculator: Shared profit calculator (creates one if not provided)
         """
         self.min_profit_cents = min_profit_cents
         self.rules = rules or self.DEFAULT_RULES
-        self.calculator = ProfitCalculator()
+        self.calculator = calculator or ProfitCalculator()
+
+        # Compile each rule's glob patterns once rather than per match
+        self._compiled_rules: list[tuple[re.Pattern, re.Pattern, CorrelationRule]] = [
+            (
+                re.compile(fnmatch.translate(rule.market_a_pattern)),
+                re.compile(fnmatch.translate(rule.market_b_pattern)),
+                rule,
+            )
+            for rule in self.rules
+        ]
+
+        # Literal text each pattern requires, used to skip rules with a
+        # substring check before running either regex
+        self._rule_literals: list[tuple[str, str]] = [
+            (
+                self._required_literal(rule.market_a_pattern),
+                self._required_literal(rule.market_b_pattern),
+            )
+            for rule in self.rules
+        ]
+
+        # Rules are fixed after construction, so matches depend only on the
+        # ticker pair; cache them per instance across scan ticks
+        self._match_tickers = lru_cache(maxsize=4096)(self._match_tickers_uncached)
 
     def detect_implies(
         self,
@@ -99,6 +128,7 @@ class CorrelatedStrategy:
         consequent: Market,
         antecedent_ob: Orderbook,
         consequent_ob: Orderbook,
+        detected_at: Optional[int] = None,
     ) -> Optional[ArbitrageOpportunity]:
         """Detect arbitrage from implication violation.
 
@@ -114,6 +144,8 @@ class CorrelatedStrategy:
             consequent: Market B (the "then" condition)
             antecedent_ob: Orderbook for A
             consequent_ob: Orderbook for B
+            detected_at: Detection time in Unix nanoseconds, shared across a
+                scan batch; defaults to now
 
         Returns:
             ArbitrageOpportunity if found
@@ -129,6 +161,22 @@ class CorrelatedStrategy:
         if price_diff <= 0:
             return None
 
+        # Calculate profits
+        gross_profit = price_diff
+        fees = self.calculator.calculate_fees_for_prices([b_ask])
+        net_profit = gross_profit - fees
+
+        if net_profit < self.min_profit_cents:
+            return None
+
+        max_qty = min(
+            self._get_bid_quantity(antecedent_ob),
+            consequent_ob.yes_ask_quantity,
+        )
+
+        if max_qty <= 0:
+            return None
+
         legs = [
             ArbitrageLeg(
                 ticker=antecedent.ticker,
@@ -146,24 +194,8 @@ class CorrelatedStrategy:
             ),
         ]
 
-        # Calculate profits
-        gross_profit = price_diff
-        fees = self.calculator.calculate_total_fees(legs)
-        net_profit = gross_profit - fees
-
-        if net_profit < self.min_profit_cents:
-            return None
-
-        max_qty = min(
-            self._get_bid_quantity(antecedent_ob),
-            consequent_ob.yes_ask_quantity,
-        )
-
-        if max_qty <= 0:
-            return None
-
         opportunity = ArbitrageOpportunity(
-            id=str(uuid.uuid4()),
+            id=new_opportunity_id("opp"),
             type=ArbitrageType.CORRELATED,
             event_ticker=f"{antecedent.event_ticker}+{consequent.event_ticker}",
             legs=legs,
@@ -173,7 +205,7 @@ class CorrelatedStrategy:
             estimated_fees_cents=fees,
             net_profit_cents=net_profit,
             max_quantity=max_qty,
-            detected_at=datetime.utcnow(),
+            detected_at=detected_at or time.time_ns(),
             confidence=0.8,
         )
 
@@ -194,6 +226,7 @@ class CorrelatedStrategy:
         market_b: Market,
         orderbook_a: Orderbook,
         orderbook_b: Orderbook,
+        detected_at: Optional[int] = None,
     ) -> Optional[ArbitrageOpportunity]:
         """Detect arbitrage from exclusion violation.
 
@@ -212,6 +245,8 @@ class CorrelatedStrategy:
             market_b: Second market
             orderbook_a: Orderbook for A
             orderbook_b: Orderbook for B
+            detected_at: Detection time in Unix nanoseconds, shared across a
+                scan batch; defaults to now
 
         Returns:
             ArbitrageOpportunity if found
@@ -228,6 +263,21 @@ class CorrelatedStrategy:
         if total_cost >= 100:
             return None
 
+        gross_profit = 100 - total_cost
+        fees = self.calculator.calculate_fees_for_prices([a_ask, b_ask])
+        net_profit = gross_profit - fees
+
+        if net_profit < self.min_profit_cents:
+            return None
+
+        max_qty = min(
+            orderbook_a.yes_ask_quantity,
+            orderbook_b.yes_ask_quantity,
+        )
+
+        if max_qty <= 0:
+            return None
+
         legs = [
             ArbitrageLeg(
                 ticker=market_a.ticker,
@@ -245,23 +295,8 @@ class CorrelatedStrategy:
             ),
         ]
 
-        gross_profit = 100 - total_cost
-        fees = self.calculator.calculate_total_fees(legs)
-        net_profit = gross_profit - fees
-
-        if net_profit < self.min_profit_cents:
-            return None
-
-        max_qty = min(
-            orderbook_a.yes_ask_quantity,
-            orderbook_b.yes_ask_quantity,
-        )
-
-        if max_qty <= 0:
-            return None
-
         opportunity = ArbitrageOpportunity(
-            id=str(uuid.uuid4()),
+            id=new_opportunity_id("opp"),
             type=ArbitrageType.CORRELATED,
             event_ticker=f"{market_a.event_ticker}+{market_b.event_ticker}",
             legs=legs,
@@ -271,7 +306,7 @@ class CorrelatedStrategy:
             estimated_fees_cents=fees,
             net_profit_cents=net_profit,
             max_quantity=max_qty,
-            detected_at=datetime.utcnow(),
+            detected_at=detected_at or time.time_ns(),
             confidence=0.85,
         )
 
@@ -285,6 +320,102 @@ class CorrelatedStrategy:
 
         return opportunity
 
+    def scan_excludes(
+        self,
+        pairs: list[tuple[Market, Market]],
+        orderbooks: dict[str, Orderbook],
+    ) -> list[ArbitrageOpportunity]:
+        """Run detect_excludes over many market pairs.
+
+        Each market's best YES ask is computed once and the cheap
+        ``a_ask + b_ask < 100`` filter is applied across all pairs before
+        any per-pair opportunity construction.
+
+        Args:
+            pairs: (market_a, market_b) pairs to check
+            orderbooks: Dict mapping ticker to orderbook
+
+        Returns:
+            Opportunities found, in pair order
+        """
+        asks: dict[str, Optional[int]] = {}
+        for pair in pairs:
+            for market in pair:
+                ticker = market.ticker
+                if ticker not in asks:
+                    ob = orderbooks.get(ticker)
+                    asks[ticker] = ob.best_yes_ask if ob else None
+
+        detected_at = time.time_ns()
+        opportunities: list[ArbitrageOpportunity] = []
+        for market_a, market_b in pairs:
+            a_ask = asks[market_a.ticker]
+            b_ask = asks[market_b.ticker]
+            if a_ask is None or b_ask is None or a_ask + b_ask >= 100:
+                continue
+
+            opp = self.detect_excludes(
+                market_a,
+                market_b,
+                orderbooks[market_a.ticker],
+                orderbooks[market_b.ticker],
+                detected_at=detected_at,
+            )
+            if opp:
+                opportunities.append(opp)
+
+        return opportunities
+
+    def scan_implies(
+        self,
+        pairs: list[tuple[Market, Market]],
+        orderbooks: dict[str, Orderbook],
+    ) -> list[ArbitrageOpportunity]:
+        """Run detect_implies over many market pairs.
+
+        Antecedent bids and consequent asks are computed once per market
+        and the ``a_bid > b_ask`` filter is applied across all pairs before
+        any per-pair opportunity construction.
+
+        Args:
+            pairs: (antecedent, consequent) pairs to check
+            orderbooks: Dict mapping ticker to orderbook
+
+        Returns:
+            Opportunities found, in pair order
+        """
+        bids: dict[str, Optional[int]] = {}
+        asks: dict[str, Optional[int]] = {}
+        for antecedent, consequent in pairs:
+            ticker = antecedent.ticker
+            if ticker not in bids:
+                ob = orderbooks.get(ticker)
+                bids[ticker] = ob.best_yes_bid if ob else None
+            ticker = consequent.ticker
+            if ticker not in asks:
+                ob = orderbooks.get(ticker)
+                asks[ticker] = ob.best_yes_ask if ob else None
+
+        detected_at = time.time_ns()
+        opportunities: list[ArbitrageOpportunity] = []
+        for antecedent, consequent in pairs:
+            a_bid = bids[antecedent.ticker]
+            b_ask = asks[consequent.ticker]
+            if a_bid is None or b_ask is None or a_bid <= b_ask:
+                continue
+
+            opp = self.detect_implies(
+                antecedent,
+                consequent,
+                orderbooks[antecedent.ticker],
+                orderbooks[consequent.ticker],
+                detected_at=detected_at,
+            )
+            if opp:
+                opportunities.append(opp)
+
+        return opportunities
+
     def detect_equivalent(
         self,
         market_a: Market,
@@ -292,6 +423,7 @@ class CorrelatedStrategy:
         orderbook_a: Orderbook,
         orderbook_b: Orderbook,
         price_threshold: int = 5,
+        detected_at: Optional[int] = None,
     ) -> Optional[ArbitrageOpportunity]:
         """Detect arbitrage from equivalent market mispricing.
 
@@ -304,6 +436,8 @@ class CorrelatedStrategy:
             orderbook_a: Orderbook for A
             orderbook_b: Orderbook for B
             price_threshold: Minimum price difference
+            detected_at: Detection time in Unix nanoseconds, shared across a
+                scan batch; defaults to now
 
         Returns:
             ArbitrageOpportunity if found
@@ -313,7 +447,7 @@ class CorrelatedStrategy:
         b_bid = orderbook_b.best_yes_bid
         b_ask = orderbook_b.best_yes_ask
 
-        if None in (a_bid, a_ask, b_bid, b_ask):
+        if a_bid is None or a_ask is None or b_bid is None or b_ask is None:
             return None
 
         # Check A_bid > B_ask (sell A, buy B)
@@ -325,6 +459,7 @@ class CorrelatedStrategy:
                 buy_price=b_ask,
                 sell_ob=orderbook_a,
                 buy_ob=orderbook_b,
+                detected_at=detected_at,
             )
 
         # Check B_bid > A_ask (sell B, buy A)
@@ -336,6 +471,7 @@ class CorrelatedStrategy:
                 buy_price=a_ask,
                 sell_ob=orderbook_b,
                 buy_ob=orderbook_a,
+                detected_at=detected_at,
             )
 
         return None
@@ -348,8 +484,24 @@ class CorrelatedStrategy:
         buy_price: int,
         sell_ob: Orderbook,
         buy_ob: Orderbook,
+        detected_at: Optional[int] = None,
     ) -> Optional[ArbitrageOpportunity]:
         """Create opportunity for equivalent market mispricing."""
+        gross_profit = sell_price - buy_price
+        fees = self.calculator.calculate_fees_for_prices([buy_price])
+        net_profit = gross_profit - fees
+
+        if net_profit < self.min_profit_cents:
+            return None
+
+        max_qty = min(
+            self._get_bid_quantity(sell_ob),
+            buy_ob.yes_ask_quantity,
+        )
+
+        if max_qty <= 0:
+            return None
+
         legs = [
             ArbitrageLeg(
                 ticker=sell_market.ticker,
@@ -367,23 +519,8 @@ class CorrelatedStrategy:
             ),
         ]
 
-        gross_profit = sell_price - buy_price
-        fees = self.calculator.calculate_total_fees(legs)
-        net_profit = gross_profit - fees
-
-        if net_profit < self.min_profit_cents:
-            return None
-
-        max_qty = min(
-            self._get_bid_quantity(sell_ob),
-            buy_ob.yes_ask_quantity,
-        )
-
-        if max_qty <= 0:
-            return None
-
         return ArbitrageOpportunity(
-            id=str(uuid.uuid4()),
+            id=new_opportunity_id("opp"),
             type=ArbitrageType.CORRELATED,
             event_ticker=f"{sell_market.event_ticker}={buy_market.event_ticker}",
             legs=legs,
@@ -393,20 +530,13 @@ class CorrelatedStrategy:
             estimated_fees_cents=fees,
             net_profit_cents=net_profit,
             max_quantity=max_qty,
-            detected_at=datetime.utcnow(),
+            detected_at=detected_at or time.time_ns(),
             confidence=0.9,
         )
 
     def _get_bid_quantity(self, orderbook: Orderbook) -> int:
         """Get quantity at best YES bid."""
-        if not orderbook.yes_bids:
-            return 0
-        best_price = orderbook.best_yes_bid
-        return sum(
-            level.quantity
-            for level in orderbook.yes_bids
-            if level.price == best_price
-        )
+        return orderbook.yes_bid_quantity
 
     def match_rule(
         self,
@@ -422,23 +552,48 @@ class CorrelatedStrategy:
         Returns:
             Matching rule or None
         """
-        import fnmatch
+        return self._match_tickers(market_a.ticker, market_b.ticker)
 
-        for rule in self.rules:
+    def _match_tickers_uncached(
+        self,
+        ticker_a: str,
+        ticker_b: str,
+    ) -> Optional[CorrelationRule]:
+        """Find the first rule matching a ticker pair in either order."""
+        for (pattern_a, pattern_b, rule), (lit_a, lit_b) in zip(
+            self._compiled_rules, self._rule_literals
+        ):
             # Check A matches pattern A and B matches pattern B
-            if fnmatch.fnmatch(market_a.ticker, rule.market_a_pattern) and fnmatch.fnmatch(
-                market_b.ticker, rule.market_b_pattern
+            if (
+                lit_a in ticker_a
+                and lit_b in ticker_b
+                and pattern_a.match(ticker_a)
+                and pattern_b.match(ticker_b)
             ):
                 return rule
 
             # Check reverse (B matches A pattern, A matches B pattern)
-            if fnmatch.fnmatch(market_b.ticker, rule.market_a_pattern) and fnmatch.fnmatch(
-                market_a.ticker, rule.market_b_pattern
+            if (
+                lit_a in ticker_b
+                and lit_b in ticker_a
+                and pattern_a.match(ticker_b)
+                and pattern_b.match(ticker_a)
             ):
                 return rule
 
         return None
 
+    @staticmethod
+    def _required_literal(pattern: str) -> str:
+        """Get the longest literal run a glob pattern requires.
+
+        Patterns with character classes return an empty string, which
+        every ticker contains, so they always fall through to the regex.
+        """
+        if "[" in pattern:
+            return ""
+        return max(re.split(r"[*?]", pattern), key=len)
+
     def validate_opportunity(
         self,
         opportunity: ArbitrageOpportunity,
@@ -448,12 +603,19 @@ class CorrelatedStrategy:
         if len(opportunity.legs) != 2:
             return False
 
-        for leg in opportunity.legs:
+        sell = OrderAction.SELL
+        legs = opportunity.legs
+        # Asks move faster than bids, so check a BUY leg first to fail
+        # stale opportunities with fewer orderbook lookups
+        if legs[0].action is sell:
+            legs = (legs[1], legs[0])
+
+        for leg in legs:
             ob = orderbooks.get(leg.ticker)
             if not ob:
                 return False
 
-            if leg.action == OrderAction.SELL:
+            if leg.action is sell:
                 current_bid = ob.best_yes_bid
                 if current_bid is None or current_bid < leg.price:
                     return False
@@ -4,8 +4,8 @@ Detects opportunities when the sum of YES acquisition costs across
 all outcomes in an event is less than 100 cents (guaranteed payout).
 """
 
-import uuid
-from datetime import datetime
+import sys
+import time
 from typing import Optional
 
 from config.logging_config import get_logger
@@ -18,10 +18,15 @@ from src.data.models import (
     Orderbook,
     OrderAction,
     OrderSide,
+    new_opportunity_id,
 )
 
 logger = get_logger(__name__)
 
+# Enum members bound once for leg construction in detect
+_YES = OrderSide.YES
+_BUY = OrderAction.BUY
+
 
 class MultiOutcomeStrategy:
     """Multi-outcome arbitrage strategy.
@@ -48,6 +53,7 @@ class MultiOutcomeStrategy:
         min_profit_cents: int = 2,
         min_markets: int = 2,
         max_markets: int = 10,
+        calculator: Optional[ProfitCalculator] = None,
     ) -> None:
         """Initialize multi-outcome strategy.
 
@@ -55,22 +61,26 @@ class MultiOutcomeStrategy:
             min_profit_cents: Minimum net profit to report opportunity
             min_markets: Minimum markets required for valid event
             max_markets: Maximum markets to consider
+            calculator: Shared profit calculator (creates one if not provided)
         """
         self.min_profit_cents = min_profit_cents
         self.min_markets = min_markets
         self.max_markets = max_markets
-        self.calculator = ProfitCalculator()
+        self.calculator = calculator or ProfitCalculator()
 
     def detect(
         self,
         markets: list[Market],
         orderbooks: dict[str, Orderbook],
+        detected_at: Optional[int] = None,
     ) -> Optional[ArbitrageOpportunity]:
         """Detect multi-outcome arbitrage opportunity.
 
         Args:
             markets: List of markets in the event
             orderbooks: Dict mapping ticker to orderbook
+            detected_at: Detection time in Unix nanoseconds, shared across a
+                scan batch; defaults to now
 
         Returns:
             ArbitrageOpportunity if found, None otherwise
@@ -86,10 +96,15 @@ class MultiOutcomeStrategy:
             )
             return None
 
-        # Build legs for each market
-        legs: list[ArbitrageLeg] = []
-        max_quantities: dict[str, int] = {}
+        # Gather prices and quantities first; legs are only built once the
+        # event passes the profitability checks
+        asks: list[int] = []
+        quantities: list[int] = []
         total_cost = 0
+        min_qty = sys.maxsize
+        # Fees are never negative, so once the running cost passes this the
+        # event cannot clear min_profit_cents
+        max_cost = self.GUARANTEED_PAYOUT - self.min_profit_cents
 
         for market in markets:
             orderbook = orderbooks.get(market.ticker)
@@ -97,29 +112,24 @@ class MultiOutcomeStrategy:
                 logger.debug("Missing orderbook", ticker=market.ticker)
                 return None
 
-            # Get best YES ask price (implied from NO bids)
-            yes_ask = orderbook.best_yes_ask
+            # Best YES ask (implied from NO bids) and quantity available there
+            yes_ask, quantity = orderbook.best_ask_with_qty()
             if yes_ask is None:
                 logger.debug("No YES ask available", ticker=market.ticker)
                 return None
 
-            # Get available quantity at best ask
-            quantity = orderbook.yes_ask_quantity
             if quantity <= 0:
                 logger.debug("No quantity available", ticker=market.ticker)
                 return None
 
-            legs.append(
-                ArbitrageLeg(
-                    ticker=market.ticker,
-                    side=OrderSide.YES,
-                    action=OrderAction.BUY,
-                    price=yes_ask,
-                    quantity=1,  # Will be adjusted based on max available
-                )
-            )
-            max_quantities[market.ticker] = quantity
             total_cost += yes_ask
+            if total_cost > max_cost:
+                return None
+
+            asks.append(yes_ask)
+            quantities.append(quantity)
+            if quantity < min_qty:
+                min_qty = quantity
 
         # Check if arbitrage exists (total cost < guaranteed payout)
         if total_cost >= self.GUARANTEED_PAYOUT:
@@ -127,7 +137,7 @@ class MultiOutcomeStrategy:
 
         # Calculate profits
         gross_profit = self.GUARANTEED_PAYOUT - total_cost
-        fees = self.calculator.calculate_total_fees(legs)
+        fees = self.calculator.calculate_fees_for_prices(asks)
         net_profit = gross_profit - fees
 
         if net_profit < self.min_profit_cents:
@@ -140,14 +150,25 @@ class MultiOutcomeStrategy:
             )
             return None
 
+        legs = [
+            ArbitrageLeg(
+                ticker=market.ticker,
+                side=_YES,
+                action=_BUY,
+                price=yes_ask,
+                quantity=1,  # Will be adjusted based on max available
+            )
+            for market, yes_ask in zip(markets, asks)
+        ]
+
         # Determine max quantity across all legs
-        max_qty = min(max_quantities.values())
+        max_qty = min_qty
 
         # Get event ticker from first market
         event_ticker = markets[0].event_ticker if markets else "unknown"
 
         opportunity = ArbitrageOpportunity(
-            id=str(uuid.uuid4()),
+            id=new_opportunity_id("mo"),
             type=ArbitrageType.MULTI_OUTCOME,
             event_ticker=event_ticker,
             legs=legs,
@@ -157,8 +178,10 @@ class MultiOutcomeStrategy:
             estimated_fees_cents=fees,
             net_profit_cents=net_profit,
             max_quantity=max_qty,
-            detected_at=datetime.utcnow(),
-            confidence=self._calculate_confidence(markets, orderbooks),
+            detected_at=detected_at or time.time_ns(),
+            confidence=self._calculate_confidence(
+                quantities, len(quantities), len(markets)
+            ),
         )
 
         logger.info(
@@ -174,8 +197,9 @@ class MultiOutcomeStrategy:
 
     def _calculate_confidence(
         self,
-        markets: list[Market],
-        orderbooks: dict[str, Orderbook],
+        quantities: list[int],
+        coverage_num: int,
+        coverage_den: int,
     ) -> float:
         """Calculate confidence score for opportunity.
 
@@ -185,27 +209,22 @@ class MultiOutcomeStrategy:
         - More liquid markets
 
         Args:
-            markets: List of markets
-            orderbooks: Dict of orderbooks
+            quantities: Quantity at best YES ask for each priced market
+            coverage_num: Number of markets with orderbooks
+            coverage_den: Number of markets in the event
 
         Returns:
             Confidence score 0-1
         """
-        if not markets:
+        if not coverage_den:
             return 0.0
 
         # Factor 1: Average quantity available
-        quantities = []
-        for market in markets:
-            ob = orderbooks.get(market.ticker)
-            if ob:
-                quantities.append(ob.yes_ask_quantity)
-
         avg_qty = sum(quantities) / len(quantities) if quantities else 0
         qty_score = min(avg_qty / 100, 1.0)  # Max out at 100 contracts
 
         # Factor 2: All markets have orderbooks
-        coverage = len(orderbooks) / len(markets)
+        coverage = coverage_num / coverage_den
 
         # Combined score
         return (qty_score * 0.5 + coverage * 0.5)
@@ -231,23 +250,17 @@ class MultiOutcomeStrategy:
             if not orderbook:
                 return False
 
-            yes_ask = orderbook.best_yes_ask
-            if yes_ask is None:
-                return False
-
-            # Check price hasn't moved adversely
-            if yes_ask > leg.price:
-                return False
-
-            # Check quantity still available
-            if orderbook.yes_ask_quantity < leg.quantity:
+            # Ask must still exist, not have moved adversely, and still have
+            # enough quantity behind it
+            yes_ask, quantity = orderbook.best_ask_with_qty()
+            if yes_ask is None or yes_ask > leg.price or quantity < leg.quantity:
                 return False
 
             total_cost += yes_ask
 
-        # Recalculate profitability
+        # Recalculate profitability. Fees depend only on the stored legs,
+        # which are unchanged since detection, so reuse the estimate.
         gross_profit = self.GUARANTEED_PAYOUT - total_cost
-        fees = self.calculator.calculate_total_fees(opportunity.legs)
-        net_profit = gross_profit - fees
+        net_profit = gross_profit - opportunity.estimated_fees_cents
 
         return net_profit >= self.min_profit_cents
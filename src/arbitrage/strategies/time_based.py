@@ -4,8 +4,9 @@ Detects opportunities when markets with the same underlying but
 different expirations violate temporal pricing constraints.
 """
 
-import uuid
-from datetime import datetime
+import itertools
+import time
+from operator import attrgetter
 from typing import Optional
 
 from config.logging_config import get_logger
@@ -18,10 +19,19 @@ from src.data.models import (
     Orderbook,
     OrderAction,
     OrderSide,
+    new_opportunity_id,
 )
 
 logger = get_logger(__name__)
 
+# Enum members bound once for the detect and validation paths
+_YES = OrderSide.YES
+_BUY = OrderAction.BUY
+_SELL = OrderAction.SELL
+
+# C-level key for filtering and sorting markets by expiration
+_EXP_KEY = attrgetter("expiration_time")
+
 
 class TimeBasedStrategy:
     """Time-based arbitrage strategy.
@@ -44,16 +54,18 @@ class TimeBasedStrategy:
         self,
         min_profit_cents: int = 2,
         min_price_diff: int = 3,
+        calculator: Optional[ProfitCalculator] = None,
     ) -> None:
         """Initialize time-based strategy.
 
         Args:
             min_profit_cents: Minimum net profit to report
             min_price_diff: Minimum price difference to consider
+            calculator: Shared profit calculator (creates one if not provided)
         """
         self.min_profit_cents = min_profit_cents
         self.min_price_diff = min_price_diff
-        self.calculator = ProfitCalculator()
+        self.calculator = calculator or ProfitCalculator()
 
     def detect(
         self,
@@ -61,6 +73,7 @@ class TimeBasedStrategy:
         later_market: Market,
         earlier_orderbook: Orderbook,
         later_orderbook: Orderbook,
+        detected_at: Optional[int] = None,
     ) -> Optional[ArbitrageOpportunity]:
         """Detect time-based arbitrage opportunity.
 
@@ -69,6 +82,8 @@ class TimeBasedStrategy:
             later_market: Market with later expiration
             earlier_orderbook: Orderbook for earlier market
             later_orderbook: Orderbook for later market
+            detected_at: Detection time in Unix nanoseconds, shared across a
+                scan batch; defaults to now
 
         Returns:
             ArbitrageOpportunity if found, None otherwise
@@ -78,7 +93,7 @@ class TimeBasedStrategy:
             return None
 
         # Get prices
-        earlier_yes_bid = earlier_orderbook.best_yes_bid
+        earlier_yes_bid, earlier_bid_qty = earlier_orderbook.best_bid_with_qty()
         later_yes_ask = later_orderbook.best_yes_ask
 
         if earlier_yes_bid is None or later_yes_ask is None:
@@ -91,24 +106,6 @@ class TimeBasedStrategy:
         if price_diff < self.min_price_diff:
             return None
 
-        # Build legs
-        legs = [
-            ArbitrageLeg(
-                ticker=earlier_market.ticker,
-                side=OrderSide.YES,
-                action=OrderAction.SELL,  # Sell earlier expiration
-                price=earlier_yes_bid,
-                quantity=1,
-            ),
-            ArbitrageLeg(
-                ticker=later_market.ticker,
-                side=OrderSide.YES,
-                action=OrderAction.BUY,  # Buy later expiration
-                price=later_yes_ask,
-                quantity=1,
-            ),
-        ]
-
         # Calculate profits
         # Net cost = later_ask - earlier_bid (negative if profitable)
         total_cost = later_yes_ask - earlier_yes_bid
@@ -116,7 +113,7 @@ class TimeBasedStrategy:
         # For time arb, guaranteed return depends on outcome scenarios
         # Worst case is still profitable by the price diff
         gross_profit = price_diff
-        fees = self.calculator.calculate_total_fees(legs)
+        fees = self.calculator.calculate_fees_for_prices([later_yes_ask])
         net_profit = gross_profit - fees
 
         if net_profit < self.min_profit_cents:
@@ -124,15 +121,33 @@ class TimeBasedStrategy:
 
         # Max quantity limited by both orderbooks
         max_qty = min(
-            self._get_bid_quantity(earlier_orderbook),
+            earlier_bid_qty,
             later_orderbook.yes_ask_quantity,
         )
 
         if max_qty <= 0:
             return None
 
+        # Build legs
+        legs = [
+            ArbitrageLeg(
+                ticker=earlier_market.ticker,
+                side=_YES,
+                action=_SELL,  # Sell earlier expiration
+                price=earlier_yes_bid,
+                quantity=1,
+            ),
+            ArbitrageLeg(
+                ticker=later_market.ticker,
+                side=_YES,
+                action=_BUY,  # Buy later expiration
+                price=later_yes_ask,
+                quantity=1,
+            ),
+        ]
+
         opportunity = ArbitrageOpportunity(
-            id=str(uuid.uuid4()),
+            id=new_opportunity_id("tb"),
             type=ArbitrageType.TIME_BASED,
             event_ticker=earlier_market.event_ticker,
             legs=legs,
@@ -142,7 +157,7 @@ class TimeBasedStrategy:
             estimated_fees_cents=fees,
             net_profit_cents=net_profit,
             max_quantity=max_qty,
-            detected_at=datetime.utcnow(),
+            detected_at=detected_at or time.time_ns(),
             confidence=0.9,  # Time arb is generally reliable
         )
 
@@ -156,6 +171,42 @@ class TimeBasedStrategy:
 
         return opportunity
 
+    def detect_event(
+        self,
+        markets: list[Market],
+        orderbooks: dict[str, Orderbook],
+        detected_at: Optional[int] = None,
+    ) -> list[ArbitrageOpportunity]:
+        """Detect time-based arbitrage across all markets of an event.
+
+        Args:
+            markets: Markets to analyze
+            orderbooks: Dict mapping ticker to orderbook
+            detected_at: Detection time in Unix nanoseconds, shared across a
+                scan batch; defaults to now
+
+        Returns:
+            List of detected opportunities
+        """
+        if detected_at is None:
+            detected_at = time.time_ns()
+
+        opportunities: list[ArbitrageOpportunity] = []
+
+        # Find temporal pairs whose prices already clear the threshold
+        for earlier, later in self.find_arbitrage_pairs(markets, orderbooks):
+            opp = self.detect(
+                earlier,
+                later,
+                orderbooks[earlier.ticker],
+                orderbooks[later.ticker],
+                detected_at=detected_at,
+            )
+            if opp:
+                opportunities.append(opp)
+
+        return opportunities
+
     def find_temporal_pairs(
         self,
         markets: list[Market],
@@ -170,30 +221,98 @@ class TimeBasedStrategy:
         Returns:
             List of (earlier, later) market pairs
         """
-        # Group by underlying (using event_ticker as proxy)
-        by_event: dict[str, list[Market]] = {}
-        for market in markets:
-            if market.expiration_time:
-                by_event.setdefault(market.event_ticker, []).append(market)
-
         pairs: list[tuple[Market, Market]] = []
 
-        for event_ticker, event_markets in by_event.items():
-            if len(event_markets) < 2:
-                continue
+        for event_markets in self._group_by_expiration(markets):
+            # Pair up consecutive expirations
+            pairs.extend(itertools.pairwise(event_markets))
 
-            # Sort by expiration
-            sorted_markets = sorted(
-                event_markets,
-                key=lambda m: m.expiration_time or datetime.max,
-            )
+        return pairs
+
+    def find_arbitrage_pairs(
+        self,
+        markets: list[Market],
+        orderbooks: dict[str, Orderbook],
+    ) -> list[tuple[Market, Market]]:
+        """Find the best later market to pair with each earlier market.
+
+        Unlike find_temporal_pairs this is not limited to consecutive
+        expirations. A single pass from the latest expiration backwards
+        tracks the cheapest YES ask among strictly later markets, so every
+        earlier market whose bid clears it by min_price_diff is paired with
+        that cheapest later market.
 
-            # Create pairs of consecutive expirations
-            for i in range(len(sorted_markets) - 1):
-                pairs.append((sorted_markets[i], sorted_markets[i + 1]))
+        Args:
+            markets: List of markets to analyze
+            orderbooks: Dict mapping ticker to orderbook
+
+        Returns:
+            List of (earlier, later) market pairs
+        """
+        pairs: list[tuple[Market, Market]] = []
+
+        for event_markets in self._group_by_expiration(markets):
+            event_pairs: list[tuple[Market, Market]] = []
+            # Cheapest ask among strictly later expirations
+            later_ask: Optional[int] = None
+            later_market: Optional[Market] = None
+            # Cheapest ask within the expiration currently being walked
+            block_ask: Optional[int] = None
+            block_market: Optional[Market] = None
+            block_expiration = None
+
+            for market in reversed(event_markets):
+                if market.expiration_time != block_expiration:
+                    if block_ask is not None and (
+                        later_ask is None or block_ask < later_ask
+                    ):
+                        later_ask, later_market = block_ask, block_market
+                    block_ask = block_market = None
+                    block_expiration = market.expiration_time
+
+                orderbook = orderbooks.get(market.ticker)
+                if orderbook is None:
+                    continue
+
+                if later_ask is not None:
+                    yes_bid = orderbook.best_yes_bid
+                    if (
+                        yes_bid is not None
+                        and yes_bid - later_ask >= self.min_price_diff
+                    ):
+                        event_pairs.append((market, later_market))
+
+                yes_ask = orderbook.best_yes_ask
+                if yes_ask is not None and (block_ask is None or yes_ask < block_ask):
+                    block_ask, block_market = yes_ask, market
+
+            # Walked latest-first; report earliest-first
+            event_pairs.reverse()
+            pairs.extend(event_pairs)
 
         return pairs
 
+    def _group_by_expiration(
+        self,
+        markets: list[Market],
+    ) -> list[list[Market]]:
+        """Group markets by event and sort each group by expiration.
+
+        Markets without an expiration and events with a single market
+        are dropped.
+        """
+        # Group by underlying (using event_ticker as proxy)
+        by_event: dict[str, list[Market]] = {}
+        for market in filter(_EXP_KEY, markets):
+            by_event.setdefault(market.event_ticker, []).append(market)
+
+        groups: list[list[Market]] = []
+        for event_markets in by_event.values():
+            if len(event_markets) >= 2:
+                event_markets.sort(key=_EXP_KEY)
+                groups.append(event_markets)
+        return groups
+
     def _validate_expiration_order(
         self,
         earlier: Market,
@@ -206,14 +325,7 @@ class TimeBasedStrategy:
 
     def _get_bid_quantity(self, orderbook: Orderbook) -> int:
         """Get quantity available at best YES bid."""
-        if not orderbook.yes_bids:
-            return 0
-        best_price = orderbook.best_yes_bid
-        return sum(
-            level.quantity
-            for level in orderbook.yes_bids
-            if level.price == best_price
-        )
+        return orderbook.yes_bid_quantity
 
     def validate_opportunity(
         self,
@@ -225,11 +337,11 @@ class TimeBasedStrategy:
             return False
 
         sell_leg = next(
-            (l for l in opportunity.legs if l.action == OrderAction.SELL),
+            (l for l in opportunity.legs if l.action is _SELL),
             None,
         )
         buy_leg = next(
-            (l for l in opportunity.legs if l.action == OrderAction.BUY),
+            (l for l in opportunity.legs if l.action is _BUY),
             None,
         )
 
@@ -243,7 +355,7 @@ class TimeBasedStrategy:
             return False
 
         # Check prices still valid
-        current_bid = sell_ob.best_yes_bid
+        current_bid, current_bid_qty = sell_ob.best_bid_with_qty()
         current_ask = buy_ob.best_yes_ask
 
         if current_bid is None or current_ask is None:
@@ -253,7 +365,7 @@ class TimeBasedStrategy:
             return False
 
         # Check quantities
-        if self._get_bid_quantity(sell_ob) < sell_leg.quantity:
+        if current_bid_qty < sell_leg.quantity:
             return False
         if buy_ob.yes_ask_quantity < buy_leg.quantity:
             return False
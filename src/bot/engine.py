@@ -1,19 +1,20 @@
 """Main arbitrage bot orchestrator."""
 
 import asyncio
+import random
 import signal
 from datetime import datetime
-from typing import Optional
+from typing import Any, Coroutine, Optional
 
 from config.logging_config import get_logger
 from config.settings import Settings
 from src.arbitrage.detector import ArbitrageDetector
-from src.core.authenticator import KalshiAuthenticator
+from src.core.authenticator import get_authenticator
 from src.core.client import KalshiClient
 from src.core.exceptions import CircuitBreakerOpenError
 from src.core.rate_limiter import DualRateLimiter
 from src.data.market_fetcher import MarketFetcher
-from src.data.models import ArbitrageOpportunity
+from src.data.models import ArbitrageOpportunity, Orderbook
 from src.data.orderbook_manager import OrderbookManager
 from src.data.websocket_client import KalshiWebSocketClient
 from src.execution.executor import ExecutionResult, Executor
@@ -38,6 +39,19 @@ class ArbitrageBotEngine:
     - Monitoring and alerting
     """
 
+    # WebSocket restart backoff (seconds), truncated exponential with jitter
+    BACKOFF_MIN = 1.0
+    BACKOFF_MAX = 60.0
+    BACKOFF_FACTOR = 1.618
+
+    # Coroutines executing queued opportunities. Exposure checks do not
+    # reserve capacity, so raising this lets concurrent trades each pass
+    # against the same headroom.
+    EXECUTION_WORKERS = 1
+
+    # Alerts in flight before new ones are dropped
+    MAX_PENDING_ALERTS = 32
+
     def __init__(self, settings: Settings) -> None:
         """Initialize the bot engine.
 
@@ -60,10 +74,7 @@ class ArbitrageBotEngine:
     def _init_components(self) -> None:
         """Initialize all bot components."""
         # Authentication
-        self.authenticator = KalshiAuthenticator(
-            api_key_id=self.settings.kalshi_api_key_id,
-            private_key_path=self.settings.kalshi_private_key_path,
-        )
+        self.authenticator = get_authenticator(self.settings)
 
         # Rate limiting
         self.rate_limiter = DualRateLimiter(
@@ -133,10 +144,44 @@ class ArbitrageBotEngine:
         # Track watched events
         self._watched_events: set[str] = set()
 
+        # Orderbook updates mark their event dirty; the scan loop consumes
+        # dirty events, and the pending set coalesces bursts into one scan
+        self._ticker_to_event: dict[str, str] = {}
+        self._dirty_events: asyncio.Queue[Optional[str]] = asyncio.Queue()
+        self._pending_events: set[str] = set()
+        self.orderbook_manager.subscribe(self._on_orderbook_update)
+
+        # Strong references to in-flight alert tasks
+        self._alert_tasks: set[asyncio.Task] = set()
+
+        # Detected opportunities are handed to execution workers so scans
+        # never wait on risk checks or order placement. Each event has at most
+        # one opportunity queued or executing; rescans while it is in flight
+        # are deferred so one mispricing is not traded repeatedly, and the
+        # event is rescanned once it has been handled.
+        self._opportunities: asyncio.Queue[
+            Optional[tuple[str, ArbitrageOpportunity]]
+        ] = asyncio.Queue()
+        self._queued_events: set[str] = set()
+        self._rescan_events: set[str] = set()
+
+    def _on_orderbook_update(self, ticker: str, orderbook: Orderbook) -> None:
+        """Queue a scan of the event owning an updated orderbook."""
+        event_ticker = self._ticker_to_event.get(ticker)
+        if event_ticker is not None:
+            self._mark_dirty(event_ticker)
+
+    def _mark_dirty(self, event_ticker: str) -> None:
+        """Queue a scan of an event unless one is already pending."""
+        if event_ticker in self._pending_events:
+            return
+        self._pending_events.add(event_ticker)
+        self._dirty_events.put_nowait(event_ticker)
+
     def _on_circuit_breaker_trip(self, reason: str) -> None:
         """Handle circuit breaker trip."""
         self.metrics.record_circuit_breaker_trip(reason)
-        asyncio.create_task(
+        self._spawn_alert(
             self.alerts.alert_circuit_breaker(
                 reason=reason,
                 daily_loss=self.circuit_breaker.metrics.daily_loss_cents,
@@ -148,7 +193,7 @@ class ArbitrageBotEngine:
         """Handle execution completion."""
         if result.success:
             self.metrics.record_order_filled("yes", "buy")
-            asyncio.create_task(
+            self._spawn_alert(
                 self.alerts.alert_trade_executed(
                     event_ticker="",
                     profit_cents=result.profit_cents,
@@ -158,6 +203,22 @@ class ArbitrageBotEngine:
         else:
             self.metrics.record_order_failed(result.error or "unknown")
 
+    def _spawn_alert(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """Send an alert in the background, dropping it under backpressure.
+
+        Args:
+            coro: Alert coroutine to run
+        """
+        if len(self._alert_tasks) >= self.MAX_PENDING_ALERTS:
+            coro.close()
+            self.metrics.record_alert_dropped()
+            logger.warning("Alert dropped", pending=len(self._alert_tasks))
+            return
+
+        task = asyncio.create_task(coro)
+        self._alert_tasks.add(task)
+        task.add_done_callback(self._alert_tasks.discard)
+
     async def start(self) -> None:
         """Start the bot."""
         logger.info("Starting arbitrage bot...")
@@ -182,6 +243,7 @@ class ArbitrageBotEngine:
             await asyncio.gather(
                 self._websocket_loop(),
                 self._scan_loop(),
+                *(self._execution_loop() for _ in range(self.EXECUTION_WORKERS)),
                 self._sync_loop(),
                 self._wait_for_shutdown(),
             )
@@ -197,6 +259,10 @@ class ArbitrageBotEngine:
         logger.info("Stopping arbitrage bot...")
         self._running = False
         self._shutdown_event.set()
+        # Wake the scan loop so it can observe shutdown
+        self._dirty_events.put_nowait(None)
+        for _ in range(self.EXECUTION_WORKERS):
+            self._opportunities.put_nowait(None)
 
         # Close connections
         await self.websocket_client.disconnect()
@@ -215,7 +281,7 @@ class ArbitrageBotEngine:
 
         # Update metrics
         self.metrics.update_balance(self.position_tracker.balance_cents)
-        self.metrics.update_exposure(self.position_tracker.get_total_exposure())
+        self.metrics.update_exposure(self.position_tracker.total_exposure_cents)
 
         logger.info(
             "Initial sync complete",
@@ -224,28 +290,77 @@ class ArbitrageBotEngine:
         )
 
     async def _websocket_loop(self) -> None:
-        """Run WebSocket connection loop."""
+        """Run WebSocket connection loop.
+
+        Failures back off exponentially with full jitter, so a mass
+        disconnect does not have every client retry in lockstep.
+        """
+        backoff = self.BACKOFF_MIN
+
         while self._running:
             try:
                 await self.websocket_client.run()
+                backoff = self.BACKOFF_MIN
             except Exception as e:
-                logger.error("WebSocket error", error=str(e))
+                delay = random.uniform(0, backoff)
+                logger.error(
+                    "WebSocket error", error=str(e), retry_in=round(delay, 2)
+                )
                 self.metrics.update_websocket_status(False)
-                await asyncio.sleep(5)  # Wait before reconnect
+                await asyncio.sleep(delay)
+                backoff = min(backoff * self.BACKOFF_FACTOR, self.BACKOFF_MAX)
 
     async def _scan_loop(self) -> None:
-        """Main arbitrage scanning loop."""
-        scan_interval = 1.0  # seconds
+        """Main arbitrage scanning loop.
 
+        Scans are driven by orderbook updates: each event is rescanned once
+        after its orderbooks change, however many updates arrived meanwhile.
+        """
         while self._running:
+            event_ticker = await self._dirty_events.get()
+            if event_ticker is None:
+                continue
+            self._pending_events.discard(event_ticker)
+
+            if event_ticker not in self._watched_events:
+                continue
+
             try:
-                await self._scan_for_opportunities()
+                await self._scan_event(event_ticker)
+            except Exception as e:
+                logger.error(
+                    "Scan error for event", event_ticker=event_ticker, error=str(e)
+                )
+
+    async def _execution_loop(self) -> None:
+        """Consume detected opportunities and execute them.
+
+        Several of these may run at once (see EXECUTION_WORKERS); each
+        handles one opportunity at a time.
+        """
+        while self._running:
+            item = await self._opportunities.get()
+            if item is None:
+                continue
+            event_ticker, opportunity = item
+
+            try:
+                await self._handle_opportunity(opportunity)
             except CircuitBreakerOpenError as e:
                 logger.warning("Circuit breaker open", error=str(e))
             except Exception as e:
-                logger.error("Scan error", error=str(e))
-
-            await asyncio.sleep(scan_interval)
+                logger.error(
+                    "Execution error for opportunity",
+                    opportunity=opportunity.id,
+                    error=str(e),
+                )
+            finally:
+                # Let the next scan of this event queue a fresh opportunity,
+                # and rescan now if its orderbooks changed while in flight
+                self._queued_events.discard(event_ticker)
+                if event_ticker in self._rescan_events:
+                    self._rescan_events.discard(event_ticker)
+                    self._mark_dirty(event_ticker)
 
     async def _sync_loop(self) -> None:
         """Periodic data sync loop."""
@@ -260,51 +375,60 @@ class ArbitrageBotEngine:
 
                 # Update metrics
                 self.metrics.update_balance(self.position_tracker.balance_cents)
-                self.metrics.update_exposure(self.position_tracker.get_total_exposure())
+                self.metrics.update_exposure(self.position_tracker.total_exposure_cents)
                 self.metrics.update_positions_count(len(self.position_tracker.positions))
 
                 # Update circuit breaker with current exposure
                 await self.circuit_breaker.record_exposure(
-                    self.position_tracker.get_total_exposure()
+                    self.position_tracker.total_exposure_cents
                 )
 
             except Exception as e:
                 logger.error("Sync error", error=str(e))
 
-    async def _scan_for_opportunities(self) -> None:
-        """Scan watched events for arbitrage opportunities."""
-        for event_ticker in list(self._watched_events):
-            try:
-                # Get markets and orderbooks
-                markets = self.market_fetcher.get_cached_markets_for_event(event_ticker)
-                if not markets:
-                    markets = await self.market_fetcher.get_markets_by_event(event_ticker)
+    async def _scan_event(self, event_ticker: str) -> None:
+        """Scan a single event for arbitrage opportunities.
 
-                orderbooks = self.orderbook_manager.get_all_orderbooks()
-                event_orderbooks = {
-                    m.ticker: orderbooks[m.ticker]
-                    for m in markets
-                    if m.ticker in orderbooks
-                }
+        Markets come from the fetcher's cache; expired entries refresh in
+        the background so a scan never waits on the network.
 
-                if not event_orderbooks:
-                    continue
+        Events with an opportunity still queued or executing are skipped
+        and rescanned once that opportunity has been handled.
 
-                # Detect opportunities
-                opportunities = self.detector.scan_event(markets, event_orderbooks)
+        Args:
+            event_ticker: Event ticker to scan
+        """
+        if event_ticker in self._queued_events:
+            self._rescan_events.add(event_ticker)
+            return
 
-                for opp in opportunities:
-                    await self._handle_opportunity(opp)
+        markets = self.market_fetcher.get_markets_for_event_nowait(event_ticker)
+        if not markets:
+            return
 
-            except Exception as e:
-                logger.error("Scan error for event", event=event_ticker, error=str(e))
+        event_orderbooks = self.orderbook_manager.get_orderbooks_for_tickers(
+            m.ticker for m in markets
+        )
+
+        if not event_orderbooks:
+            return
+
+        # Detect opportunities
+        opportunities = self.detector.scan_event(markets, event_orderbooks)
+        best = self.detector.get_best_opportunity(opportunities)
+
+        if best is None:
+            return
+
+        self._queued_events.add(event_ticker)
+        self._opportunities.put_nowait((event_ticker, best))
 
     async def _handle_opportunity(self, opportunity: ArbitrageOpportunity) -> None:
         """Handle a detected arbitrage opportunity."""
         logger.info(
             "Opportunity detected",
             type=opportunity.type.value,
-            event=opportunity.event_ticker,
+            event_ticker=opportunity.event_ticker,
             profit=opportunity.net_profit_cents,
         )
 
@@ -334,12 +458,12 @@ class ArbitrageBotEngine:
         if result.success:
             await self.circuit_breaker.record_trade_result(
                 profit_cents=result.profit_cents,
-                exposure_cents=self.position_tracker.get_total_exposure(),
+                exposure_cents=self.position_tracker.total_exposure_cents,
             )
         else:
             await self.circuit_breaker.record_trade_result(
                 profit_cents=-opportunity.total_cost_cents,  # Assume worst case
-                exposure_cents=self.position_tracker.get_total_exposure(),
+                exposure_cents=self.position_tracker.total_exposure_cents,
             )
 
     async def watch_event(self, event_ticker: str) -> None:
@@ -352,11 +476,16 @@ class ArbitrageBotEngine:
         markets = await self.market_fetcher.get_markets_by_event(event_ticker)
 
         if not markets:
-            logger.warning("No markets found for event", event=event_ticker)
+            logger.warning("No markets found for event", event_ticker=event_ticker)
             return
 
-        # Subscribe to orderbook updates
+        # Route orderbook updates for these markets to this event's scans
         tickers = [m.ticker for m in markets]
+        for ticker in tickers:
+            self._ticker_to_event[ticker] = event_ticker
+        self._watched_events.add(event_ticker)
+
+        # Subscribe to orderbook updates
         await self.websocket_client.subscribe_orderbook(tickers)
 
         # Fetch initial orderbooks
@@ -364,11 +493,9 @@ class ArbitrageBotEngine:
         for ticker, ob in orderbooks.items():
             await self.orderbook_manager.update_snapshot(ticker, ob)
 
-        self._watched_events.add(event_ticker)
-
         logger.info(
             "Watching event",
-            event=event_ticker,
+            event_ticker=event_ticker,
             markets=len(markets),
         )
 
@@ -383,8 +510,10 @@ class ArbitrageBotEngine:
 
         await self.websocket_client.unsubscribe_orderbook(tickers)
         self._watched_events.discard(event_ticker)
+        for ticker in tickers:
+            self._ticker_to_event.pop(ticker, None)
 
-        logger.info("Stopped watching event", event=event_ticker)
+        logger.info("Stopped watching event", event_ticker=event_ticker)
 
     async def _wait_for_shutdown(self) -> None:
         """Wait for shutdown signal."""
@@ -419,7 +548,7 @@ class ArbitrageBotEngine:
             "watched_events": list(self._watched_events),
             "websocket_connected": self.websocket_client.is_connected,
             "balance_cents": self.position_tracker.balance_cents,
-            "total_exposure_cents": self.position_tracker.get_total_exposure(),
+            "total_exposure_cents": self.position_tracker.total_exposure_cents,
             "circuit_breaker": self.circuit_breaker.get_status(),
             "execution_stats": {
                 "total_executions": len(self.executor.execution_history),
@@ -1,7 +1,7 @@
 """Core infrastructure modules."""
 
-from .authenticator import KalshiAuthenticator
-from .client import KalshiClient
+from .authenticator import KalshiAuthenticator, get_authenticator
+from .client import KalshiClient, shared_client
 from .exceptions import (
     KalshiError,
     AuthenticationError,
@@ -9,12 +9,16 @@ from .exceptions import (
     OrderError,
     InsufficientFundsError,
 )
+from .eventloop import run
 from .rate_limiter import RateLimiter
 
 __all__ = [
     "KalshiAuthenticator",
+    "get_authenticator",
     "KalshiClient",
+    "shared_client",
     "RateLimiter",
+    "run",
     "KalshiError",
     "AuthenticationError",
     "RateLimitError",
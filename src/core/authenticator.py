@@ -1,9 +1,13 @@
 """RSA-PSS signature generation for Kalshi API authentication."""
 
+import asyncio
 import base64
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from urllib.parse import urlparse
 
 from cryptography.hazmat.primitives import hashes, serialization
@@ -11,8 +15,28 @@ from cryptography.hazmat.primitives.asymmetric import padding, rsa
 
 from config.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from config.settings import Settings
+
 logger = get_logger(__name__)
 
+# Padding and hash objects are immutable; build them once instead of per sign
+_PSS_PADDING = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()),
+    salt_length=padding.PSS.MAX_LENGTH,
+)
+_SHA256 = hashes.SHA256()
+
+
+@lru_cache(maxsize=512)
+def _payload_suffix(method: str, path: str) -> str:
+    """Build the method+path part of a signature payload.
+
+    Query parameters are stripped. Endpoints repeat, so the result is
+    memoized and signing only has to prepend the timestamp.
+    """
+    return f"{method.upper()}{urlparse(path).path}"
+
 
 class KalshiAuthenticator:
     """Generates RSA-PSS signatures for Kalshi API requests.
@@ -21,8 +45,17 @@ class KalshiAuthenticator:
     - KALSHI-ACCESS-KEY: Your API key ID
     - KALSHI-ACCESS-TIMESTAMP: Unix timestamp in milliseconds
     - KALSHI-ACCESS-SIGNATURE: Base64-encoded RSA-PSS signature
+
+    Signatures are reused for the same method and path within a short
+    timestamp window, so bursts of identical requests sign only once.
     """
 
+    # Window in milliseconds during which a (method, path) signature is reused
+    SIGNATURE_REUSE_MS = 500
+
+    # Maximum cached signatures
+    SIGNATURE_CACHE_SIZE = 256
+
     def __init__(self, api_key_id: str, private_key_path: Path) -> None:
         """Initialize the authenticator.
 
@@ -32,6 +65,13 @@ class KalshiAuthenticator:
         """
         self.api_key_id = api_key_id
         self._private_key = self._load_private_key(private_key_path)
+        self._sig_cache: OrderedDict[tuple[str, int], tuple[int, str]] = (
+            OrderedDict()
+        )
+        # RSA signing releases the GIL, so async callers sign on this pool
+        # and the event loop keeps running during the modexp. Created on
+        # first use so a closed authenticator can still be reused.
+        self._sign_pool: Optional[ThreadPoolExecutor] = None
         logger.info("Authenticator initialized", api_key_id=api_key_id)
 
     def _load_private_key(self, key_path: Path) -> rsa.RSAPrivateKey:
@@ -42,9 +82,14 @@ class KalshiAuthenticator:
 
         Returns:
             RSA private key object
+
+        Raises:
+            ValueError: If the key file is missing or not an RSA private key
         """
-        with open(key_path, "rb") as f:
-            key_data = f.read()
+        try:
+            key_data = Path(key_path).read_bytes()
+        except FileNotFoundError as e:
+            raise ValueError(f"Private key file not found: {key_path}") from e
 
         private_key = serialization.load_pem_private_key(key_data, password=None)
         if not isinstance(private_key, rsa.RSAPrivateKey):
@@ -54,7 +99,7 @@ class KalshiAuthenticator:
 
     def _get_timestamp(self) -> int:
         """Get current timestamp in milliseconds."""
-        return int(time.time() * 1000)
+        return time.time_ns() // 1_000_000
 
     def _create_signature_payload(
         self,
@@ -76,10 +121,7 @@ class KalshiAuthenticator:
             String to sign
         """
         # Strip query parameters - critical for signature validation
-        parsed = urlparse(path)
-        clean_path = parsed.path
-
-        return f"{timestamp}{method.upper()}{clean_path}"
+        return f"{timestamp}{_payload_suffix(method, path)}"
 
     def _sign(self, message: str) -> str:
         """Sign a message using RSA-PSS.
@@ -91,12 +133,7 @@ class KalshiAuthenticator:
             Base64-encoded signature
         """
         signature = self._private_key.sign(
-            message.encode("utf-8"),
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH,
-            ),
-            hashes.SHA256(),
+            message.encode("utf-8"), _PSS_PADDING, _SHA256
         )
         return base64.b64encode(signature).decode("utf-8")
 
@@ -108,6 +145,10 @@ class KalshiAuthenticator:
     ) -> dict[str, str]:
         """Generate authentication headers for a request.
 
+        A signature made for the same method and path within the last
+        SIGNATURE_REUSE_MS is reused along with its original timestamp.
+        An explicit timestamp always produces a fresh signature.
+
         Args:
             method: HTTP method (GET, POST, DELETE, etc.)
             path: Request path (query params will be stripped for signing)
@@ -116,21 +157,133 @@ class KalshiAuthenticator:
         Returns:
             Dictionary of authentication headers
         """
-        ts = timestamp or self._get_timestamp()
-        payload = self._create_signature_payload(ts, method, path)
-        signature = self._sign(payload)
+        if timestamp:
+            ts = timestamp
+            signature = self._sign(self._create_signature_payload(ts, method, path))
+            return self._build_headers(ts, signature)
+
+        key, now, suffix = self._signature_key(method, path)
+        cached = self._get_cached_signature(key)
+        if cached is not None:
+            return self._build_headers(*cached)
+
+        signature = self._sign(f"{now}{suffix}")
+        self._store_signature(key, now, signature)
+        return self._build_headers(now, signature)
+
+    async def get_auth_headers_async(
+        self,
+        method: str,
+        path: str,
+    ) -> dict[str, str]:
+        """Generate authentication headers without signing on the event loop.
+
+        Behaves like get_auth_headers, but a cache miss signs on a
+        dedicated worker thread.
+
+        Args:
+            method: HTTP method (GET, POST, DELETE, etc.)
+            path: Request path (query params will be stripped for signing)
+
+        Returns:
+            Dictionary of authentication headers
+        """
+        key, now, suffix = self._signature_key(method, path)
+        cached = self._get_cached_signature(key)
+        if cached is not None:
+            return self._build_headers(*cached)
+
+        if self._sign_pool is None:
+            self._sign_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="rsa-sign"
+            )
+        signature = await asyncio.get_running_loop().run_in_executor(
+            self._sign_pool, self._sign, f"{now}{suffix}"
+        )
+        self._store_signature(key, now, signature)
+        return self._build_headers(now, signature)
+
+    def close(self) -> None:
+        """Shut down the signing thread.
 
-        headers = {
+        The pool is recreated on the next async signature, so a shared
+        authenticator stays usable after one client closes it.
+        """
+        if self._sign_pool is not None:
+            self._sign_pool.shutdown(wait=False)
+            self._sign_pool = None
+
+    def _build_headers(self, timestamp: int, signature: str) -> dict[str, str]:
+        """Assemble authentication headers."""
+        return {
             "KALSHI-ACCESS-KEY": self.api_key_id,
-            "KALSHI-ACCESS-TIMESTAMP": str(ts),
+            "KALSHI-ACCESS-TIMESTAMP": str(timestamp),
             "KALSHI-ACCESS-SIGNATURE": signature,
         }
 
-        logger.debug(
-            "Generated auth headers",
-            method=method,
-            path=path,
-            timestamp=ts,
-        )
+    def _signature_key(
+        self,
+        method: str,
+        path: str,
+    ) -> tuple[tuple[str, int], int, str]:
+        """Get the signature cache key for a request made now.
+
+        Args:
+            method: HTTP method
+            path: Request path
+
+        Returns:
+            Tuple of (cache key, timestamp in milliseconds, payload suffix)
+        """
+        now = self._get_timestamp()
+        suffix = _payload_suffix(method, path)
+        return (suffix, now // self.SIGNATURE_REUSE_MS), now, suffix
+
+    def _get_cached_signature(
+        self,
+        key: tuple[str, int],
+    ) -> Optional[tuple[int, str]]:
+        """Look up a cached (timestamp, signature) pair."""
+        cached = self._sig_cache.get(key)
+        if cached is not None:
+            self._sig_cache.move_to_end(key)
+        return cached
+
+    def _store_signature(
+        self,
+        key: tuple[str, int],
+        timestamp: int,
+        signature: str,
+    ) -> None:
+        """Cache a signature, evicting the least recently used entry."""
+        self._sig_cache[key] = (timestamp, signature)
+        if len(self._sig_cache) > self.SIGNATURE_CACHE_SIZE:
+            self._sig_cache.popitem(last=False)
+
+
+def get_authenticator(settings: Optional["Settings"] = None) -> KalshiAuthenticator:
+    """Get the shared authenticator for a set of credentials.
+
+    The private key is parsed once per (API key, key file) and the signer
+    is shared by every client that asks for it.
+
+    Args:
+        settings: Settings to take credentials from (defaults to the
+            application settings)
+
+    Returns:
+        Cached authenticator
+    """
+    if settings is None:
+        from config.settings import get_settings
+
+        settings = get_settings()
+    return _cached_authenticator(
+        settings.kalshi_api_key_id, Path(settings.kalshi_private_key_path)
+    )
+
 
-        return headers
+@lru_cache(maxsize=4)
+def _cached_authenticator(api_key_id: str, key_path: Path) -> KalshiAuthenticator:
+    """Build one authenticator per credential pair."""
+    return KalshiAuthenticator(api_key_id=api_key_id, private_key_path=key_path)
@@ -1,13 +1,15 @@
 """Async HTTP client for Kalshi API with retry logic and rate limiting."""
 
 import asyncio
-from typing import Any, Optional
-from urllib.parse import urljoin
+import random
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
 
 import aiohttp
+import orjson
 
 from config.logging_config import get_logger
-from .authenticator import KalshiAuthenticator
+from .authenticator import KalshiAuthenticator, get_authenticator
 from .exceptions import (
     AuthenticationError,
     InsufficientFundsError,
@@ -20,6 +22,11 @@ from .rate_limiter import DualRateLimiter
 logger = get_logger(__name__)
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize request bodies with orjson (aiohttp expects a str)."""
+    return orjson.dumps(obj).decode()
+
+
 class KalshiClient:
     """Async HTTP client for Kalshi API.
 
@@ -35,12 +42,24 @@ class KalshiClient:
     BACKOFF_BASE = 2.0
     BACKOFF_MAX = 60.0
 
+    # Connection pool: all traffic goes to one host, so allow most of the
+    # pool there and keep idle TLS connections alive between bursts
+    CONNECTION_LIMIT = 200
+    CONNECTION_LIMIT_PER_HOST = 64
+    KEEPALIVE_TIMEOUT = 75.0
+    DNS_CACHE_TTL = 300
+
+    # Requests allowed in flight at once; the rate limiter paces starts but
+    # does not bound how many are outstanding
+    MAX_CONCURRENT_REQUESTS = 32
+
     def __init__(
         self,
         base_url: str,
         authenticator: KalshiAuthenticator,
         rate_limiter: Optional[DualRateLimiter] = None,
         timeout: float = DEFAULT_TIMEOUT,
+        max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
     ) -> None:
         """Initialize the client.
 
@@ -49,27 +68,46 @@ class KalshiClient:
             authenticator: Authentication handler
             rate_limiter: Optional rate limiter (creates default if not provided)
             timeout: Request timeout in seconds
+            max_concurrent_requests: Cap on requests in flight at once
         """
         self.base_url = base_url.rstrip("/")
+        self._url_prefix = self.base_url + "/"
         self.authenticator = authenticator
         self.rate_limiter = rate_limiter or DualRateLimiter()
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
 
         logger.info("Kalshi client initialized", base_url=base_url)
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(timeout=self.timeout)
+            # The session owns the connector and closes it with itself
+            connector = aiohttp.TCPConnector(
+                limit=self.CONNECTION_LIMIT,
+                limit_per_host=self.CONNECTION_LIMIT_PER_HOST,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                },
+                json_serialize=_json_dumps,
+            )
         return self._session
 
     async def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session and the authenticator's signing thread."""
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
             logger.info("HTTP session closed")
+        self.authenticator.close()
 
     async def __aenter__(self) -> "KalshiClient":
         """Async context manager entry."""
@@ -81,9 +119,10 @@ class KalshiClient:
 
     def _build_url(self, path: str) -> str:
         """Build full URL from path."""
+        # API paths are always relative, so plain concatenation matches urljoin
         if path.startswith("/"):
             path = path[1:]
-        return urljoin(self.base_url + "/", path)
+        return self._url_prefix + path
 
     async def _handle_response(
         self,
@@ -104,11 +143,13 @@ class KalshiClient:
         Raises:
             Various KalshiError subclasses based on response
         """
-        # Try to parse JSON response
+        # Parse JSON straight from the body bytes (no str decode or
+        # content-type check); fall back to raw text for non-JSON errors
+        body = await response.read()
         try:
-            data = await response.json()
-        except Exception:
-            data = {"raw": await response.text()}
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            data = {"raw": body.decode("utf-8", errors="replace")}
 
         if response.status == 200:
             return data
@@ -142,6 +183,17 @@ class KalshiClient:
             {"status": response.status, **data},
         )
 
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter.
+
+        Args:
+            attempt: Zero-based attempt number
+
+        Returns:
+            Seconds to wait, uniform in [0, min(BACKOFF_BASE**attempt, MAX)]
+        """
+        return random.uniform(0, min(self.BACKOFF_BASE ** attempt, self.BACKOFF_MAX))
+
     async def _request(
         self,
         method: str,
@@ -174,36 +226,40 @@ class KalshiClient:
                 # Wait for rate limit
                 await limiter.acquire()
 
-                # Generate auth headers (path without query params)
-                auth_headers = self.authenticator.get_auth_headers(method, path)
-                headers = {
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                    **auth_headers,
-                }
-
-                logger.debug(
-                    "Making API request",
-                    method=method,
-                    url=url,
-                    attempt=attempt + 1,
-                )
-
-                async with session.request(
-                    method,
-                    url,
-                    headers=headers,
-                    params=params,
-                    json=json_data,
-                ) as response:
-                    return await self._handle_response(response, method, path)
+                # Bound in-flight requests; sign after the wait so time spent
+                # queued here does not age the timestamp. A reused signature
+                # can still be up to one SIGNATURE_REUSE_MS window old.
+                async with self._semaphore:
+                    # Generate auth headers (path without query params)
+                    headers = await self.authenticator.get_auth_headers_async(
+                        method, path
+                    )
+
+                    logger.debug(
+                        "Making API request",
+                        method=method,
+                        url=url,
+                        attempt=attempt + 1,
+                    )
+
+                    async with session.request(
+                        method,
+                        url,
+                        headers=headers,
+                        params=params,
+                        json=json_data,
+                    ) as response:
+                        return await self._handle_response(response, method, path)
 
             except RateLimitError as e:
-                # Use server-provided retry-after or exponential backoff
-                wait_time = e.retry_after or min(
-                    self.BACKOFF_BASE ** attempt,
-                    self.BACKOFF_MAX,
-                )
+                # Use server-provided retry-after (plus a little jitter so
+                # concurrent callers spread out) or jittered backoff
+                if e.retry_after:
+                    wait_time = e.retry_after + random.uniform(
+                        0, min(1.0, e.retry_after * 0.1)
+                    )
+                else:
+                    wait_time = self._backoff_delay(attempt)
                 logger.warning(
                     "Rate limited, waiting",
                     wait_seconds=wait_time,
@@ -218,7 +274,7 @@ class KalshiClient:
 
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 # Network errors - retry with backoff
-                wait_time = min(self.BACKOFF_BASE ** attempt, self.BACKOFF_MAX)
+                wait_time = self._backoff_delay(attempt)
                 logger.warning(
                     "Request failed, retrying",
                     error=str(e),
@@ -386,3 +442,39 @@ class KalshiClient:
         if ticker:
             params["ticker"] = ticker
         return await self.get("/portfolio/fills", params=params)
+
+
+_shared_client: Optional[KalshiClient] = None
+
+
+@asynccontextmanager
+async def shared_client() -> AsyncIterator[KalshiClient]:
+    """Yield a process-wide client built from application settings.
+
+    The outermost ``async with`` owns the client and closes it on exit;
+    nested uses (e.g. scripts invoked from a combined pipeline) reuse the
+    same client and its pooled connections instead of opening their own.
+    """
+    global _shared_client
+
+    if _shared_client is not None:
+        yield _shared_client
+        return
+
+    from config.settings import get_settings
+
+    settings = get_settings()
+    client = KalshiClient(
+        base_url=settings.base_url,
+        authenticator=get_authenticator(),
+        rate_limiter=DualRateLimiter(
+            read_rate=settings.read_rate_limit,
+            write_rate=settings.write_rate_limit,
+        ),
+    )
+    _shared_client = client
+    try:
+        yield client
+    finally:
+        _shared_client = None
+        await client.close()
@@ -0,0 +1,26 @@
+"""Event loop selection for script entrypoints."""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, using uvloop when it is installed.
+
+    Falls back to the default asyncio loop (e.g. on Windows or when the
+    optional ``speed`` extra is not installed).
+
+    Args:
+        main: Top-level coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    return uvloop.run(main)
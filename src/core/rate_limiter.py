@@ -17,6 +17,10 @@ class RateLimiter:
     - Each request consumes one token
     - Requests wait if no tokens are available
     - Maximum tokens capped at bucket capacity
+
+    Waiters reserve their tokens up front, letting the balance go negative,
+    so each one gets its own slot in the refill schedule. Bucket updates
+    never await, so no lock is needed on the single-threaded event loop.
     """
 
     def __init__(
@@ -34,7 +38,6 @@ class RateLimiter:
         self.bucket_size = bucket_size or int(tokens_per_second)
         self._tokens = float(self.bucket_size)
         self._last_update = time.monotonic()
-        self._lock = asyncio.Lock()
 
         logger.info(
             "Rate limiter initialized",
@@ -61,26 +64,28 @@ class RateLimiter:
         Returns:
             Time waited in seconds
         """
-        async with self._lock:
-            self._refill()
-
-            wait_time = 0.0
-            if self._tokens < tokens:
-                # Calculate wait time
-                deficit = tokens - self._tokens
-                wait_time = deficit / self.tokens_per_second
-                logger.debug("Rate limit wait", wait_seconds=wait_time)
-                await asyncio.sleep(wait_time)
-                self._refill()
+        self._refill()
 
-            self._tokens -= tokens
-            return wait_time
+        # Reserve first; a negative balance is the queue of earlier waiters
+        self._tokens -= tokens
+        if self._tokens >= 0:
+            return 0.0
+
+        wait_time = -self._tokens / self.tokens_per_second
+        logger.debug("Rate limit wait", wait_seconds=wait_time)
+        try:
+            await asyncio.sleep(wait_time)
+        except asyncio.CancelledError:
+            # Hand the reservation back for later callers
+            self._tokens += tokens
+            raise
+        return wait_time
 
     @property
     def available_tokens(self) -> float:
         """Get current number of available tokens."""
         self._refill()
-        return self._tokens
+        return max(self._tokens, 0.0)
 
 
 class DualRateLimiter:
@@ -104,6 +109,12 @@ class DualRateLimiter:
         """
         self.read_limiter = RateLimiter(read_rate)
         self.write_limiter = RateLimiter(write_rate)
+        # Anything not listed here is treated as a write
+        self._limiters = {
+            "GET": self.read_limiter,
+            "HEAD": self.read_limiter,
+            "OPTIONS": self.read_limiter,
+        }
 
     async def acquire_read(self) -> float:
         """Acquire a read token."""
@@ -122,6 +133,8 @@ class DualRateLimiter:
         Returns:
             Appropriate rate limiter
         """
-        if method.upper() in ("GET", "HEAD", "OPTIONS"):
-            return self.read_limiter
-        return self.write_limiter
+        limiter = self._limiters.get(method)
+        if limiter is None:
+            # Fall back for lowercase methods
+            limiter = self._limiters.get(method.upper(), self.write_limiter)
+        return limiter
@@ -1,12 +1,14 @@
 """REST API market data fetching."""
 
-from collections import defaultdict
+import asyncio
+import time
+from collections import OrderedDict, defaultdict
 from datetime import datetime
 from typing import Optional
 
 from config.logging_config import get_logger
 from src.core.client import KalshiClient
-from .models import Market, Orderbook, OrderbookLevel
+from .models import Market, Orderbook
 
 logger = get_logger(__name__)
 
@@ -14,6 +16,15 @@ logger = get_logger(__name__)
 class MarketFetcher:
     """Fetches and manages market data from Kalshi REST API."""
 
+    # How long fetched event markets stay fresh (seconds)
+    EVENT_MARKETS_TTL = 60.0
+
+    # Events that returned no markets are retried sooner
+    EMPTY_EVENT_TTL = 5.0
+
+    # Markets kept in the cache; least recently used are evicted beyond this
+    MARKET_CACHE_SIZE = 10_000
+
     def __init__(self, client: KalshiClient) -> None:
         """Initialize market fetcher.
 
@@ -21,8 +32,11 @@ class MarketFetcher:
             client: Kalshi API client
         """
         self.client = client
-        self._market_cache: dict[str, Market] = {}
+        self._market_cache: OrderedDict[str, Market] = OrderedDict()
         self._event_markets: dict[str, list[str]] = defaultdict(list)
+        self._event_fetched_at: dict[str, float] = {}
+        self._event_refreshes: dict[str, asyncio.Task] = {}
+        self._orderbook_fetches: dict[tuple[str, int], asyncio.Task] = {}
 
     async def get_market(self, ticker: str, use_cache: bool = True) -> Market:
         """Get market by ticker.
@@ -35,11 +49,12 @@ class MarketFetcher:
             Market object
         """
         if use_cache and ticker in self._market_cache:
+            self._market_cache.move_to_end(ticker)
             return self._market_cache[ticker]
 
         response = await self.client.get_market(ticker)
         market = self._parse_market(response.get("market", response))
-        self._market_cache[ticker] = market
+        self._cache_market(market)
         return market
 
     async def get_markets_by_event(
@@ -57,26 +72,38 @@ class MarketFetcher:
             List of markets for the event
         """
         markets: list[Market] = []
-        cursor: Optional[str] = None
-
-        while True:
-            response = await self.client.get_markets(
-                event_ticker=event_ticker,
-                status=status,
-                cursor=cursor,
-            )
-
-            for market_data in response.get("markets", []):
-                market = self._parse_market(market_data)
-                markets.append(market)
-                self._market_cache[market.ticker] = market
+        page: Optional[asyncio.Task] = asyncio.create_task(
+            self.client.get_markets(event_ticker=event_ticker, status=status)
+        )
 
-            cursor = response.get("cursor")
-            if not cursor:
-                break
+        try:
+            while page is not None:
+                response = await page
+
+                # Request the next page before parsing this one so parsing
+                # overlaps the round trip
+                cursor = response.get("cursor")
+                page = None
+                if cursor:
+                    page = asyncio.create_task(
+                        self.client.get_markets(
+                            event_ticker=event_ticker,
+                            status=status,
+                            cursor=cursor,
+                        )
+                    )
+
+                for market_data in response.get("markets", []):
+                    market = self._parse_market(market_data)
+                    markets.append(market)
+                    self._cache_market(market)
+        finally:
+            if page is not None and not page.done():
+                page.cancel()
 
         # Update event-to-markets mapping
         self._event_markets[event_ticker] = [m.ticker for m in markets]
+        self._event_fetched_at[event_ticker] = time.monotonic()
 
         logger.info(
             "Fetched markets for event",
@@ -89,6 +116,8 @@ class MarketFetcher:
     async def get_orderbook(self, ticker: str, depth: int = 10) -> Orderbook:
         """Get orderbook for a market.
 
+        Concurrent calls for the same ticker and depth share one request.
+
         Args:
             ticker: Market ticker
             depth: Number of price levels
@@ -96,6 +125,18 @@ class MarketFetcher:
         Returns:
             Orderbook object
         """
+        key = (ticker, depth)
+        task = self._orderbook_fetches.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_orderbook(ticker, depth))
+            self._orderbook_fetches[key] = task
+            task.add_done_callback(lambda _: self._orderbook_fetches.pop(key, None))
+
+        # Shield so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    async def _fetch_orderbook(self, ticker: str, depth: int) -> Orderbook:
+        """Fetch and parse an orderbook from the API."""
         response = await self.client.get_orderbook(ticker, depth)
         return self._parse_orderbook(ticker, response.get("orderbook", response))
 
@@ -117,17 +158,25 @@ class MarketFetcher:
         if event_ticker not in self._event_markets:
             await self.get_markets_by_event(event_ticker)
 
+        # Fetch concurrently; the client's read rate limiter paces requests
+        tickers = list(self._event_markets.get(event_ticker, []))
+        results = await asyncio.gather(
+            *(self.get_orderbook(ticker, depth) for ticker in tickers),
+            return_exceptions=True,
+        )
+
         orderbooks: dict[str, Orderbook] = {}
-        for ticker in self._event_markets.get(event_ticker, []):
-            try:
-                orderbook = await self.get_orderbook(ticker, depth)
-                orderbooks[ticker] = orderbook
-            except Exception as e:
+        for ticker, result in zip(tickers, results):
+            if isinstance(result, Exception):
                 logger.warning(
                     "Failed to fetch orderbook",
                     ticker=ticker,
-                    error=str(e),
+                    error=str(result),
                 )
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            orderbooks[ticker] = result
 
         return orderbooks
 
@@ -166,10 +215,67 @@ class MarketFetcher:
         tickers = self._event_markets.get(event_ticker, [])
         return [self._market_cache[t] for t in tickers if t in self._market_cache]
 
+    def get_markets_for_event_nowait(self, event_ticker: str) -> list[Market]:
+        """Get cached markets for an event without waiting on the network.
+
+        If the cached entry is missing or expired, a background refresh is
+        started and the current (possibly stale or empty) markets are
+        returned immediately. Empty results expire after EMPTY_EVENT_TTL so
+        events with no markets are not refetched on every call.
+
+        Args:
+            event_ticker: Event ticker
+
+        Returns:
+            List of cached markets
+        """
+        markets = self.get_cached_markets_for_event(event_ticker)
+
+        fetched_at = self._event_fetched_at.get(event_ticker)
+        ttl = self.EVENT_MARKETS_TTL if markets else self.EMPTY_EVENT_TTL
+        if fetched_at is None or time.monotonic() - fetched_at > ttl:
+            self._refresh_event_markets(event_ticker)
+
+        return markets
+
+    def _refresh_event_markets(self, event_ticker: str) -> None:
+        """Start a background fetch of an event's markets if none is running."""
+        if event_ticker in self._event_refreshes:
+            return
+
+        task = asyncio.create_task(self.get_markets_by_event(event_ticker))
+        self._event_refreshes[event_ticker] = task
+        task.add_done_callback(
+            lambda t: self._on_event_refresh_done(event_ticker, t)
+        )
+
+    def _on_event_refresh_done(self, event_ticker: str, task: asyncio.Task) -> None:
+        """Clear a finished background refresh and log any failure."""
+        self._event_refreshes.pop(event_ticker, None)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            # Back off like an empty result rather than retrying every call
+            self._event_fetched_at[event_ticker] = time.monotonic()
+            logger.warning(
+                "Failed to refresh event markets",
+                event_ticker=event_ticker,
+                error=str(error),
+            )
+
+    def _cache_market(self, market: Market) -> None:
+        """Cache a market, evicting the least recently used beyond the bound."""
+        self._market_cache[market.ticker] = market
+        self._market_cache.move_to_end(market.ticker)
+        if len(self._market_cache) > self.MARKET_CACHE_SIZE:
+            self._market_cache.popitem(last=False)
+
     def clear_cache(self) -> None:
         """Clear all cached data."""
         self._market_cache.clear()
         self._event_markets.clear()
+        self._event_fetched_at.clear()
         logger.info("Market cache cleared")
 
     def _parse_market(self, data: dict) -> Market:
@@ -192,20 +298,9 @@ class MarketFetcher:
 
     def _parse_orderbook(self, ticker: str, data: dict) -> Orderbook:
         """Parse orderbook data from API response."""
-        yes_bids = [
-            OrderbookLevel(price=level[0], quantity=level[1])
-            for level in data.get("yes", [])
-        ]
-        no_bids = [
-            OrderbookLevel(price=level[0], quantity=level[1])
-            for level in data.get("no", [])
-        ]
-
-        return Orderbook(
-            ticker=ticker,
-            yes_bids=yes_bids,
-            no_bids=no_bids,
-            timestamp=datetime.utcnow(),
+        # Empty sides may come back as null
+        return Orderbook.from_levels(
+            ticker, data.get("yes") or [], data.get("no") or []
         )
 
     def _parse_datetime(self, value: Optional[str]) -> Optional[datetime]:
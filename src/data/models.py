@@ -1,11 +1,21 @@
 """Pydantic data models for Kalshi trading bot."""
 
-from datetime import datetime
+import itertools
+import os
+import sys
+import time
+from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Annotated, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import AfterValidator, BaseModel, Field, PrivateAttr, field_validator
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Tickers are interned on ingestion so the many dict lookups keyed by ticker
+# hit the identity fast path instead of comparing string contents
+Ticker = Annotated[str, AfterValidator(sys.intern)]
 
 
 class OrderSide(str, Enum):
@@ -66,24 +76,86 @@ class Orderbook(BaseModel):
     at price X is a NO bid at (100 - X).
     """
 
-    ticker: str
+    ticker: Ticker
     yes_bids: list[OrderbookLevel] = Field(default_factory=list)
     no_bids: list[OrderbookLevel] = Field(default_factory=list)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: int = Field(
+        default_factory=time.time_ns,
+        description="Last update time in Unix nanoseconds",
+    )
+
+    # Lazily computed (best_yes_bid, yes_qty, best_no_bid, no_qty); a price
+    # of 0 means that side is empty
+    _top_of_book: Optional[tuple[int, int, int, int]] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_levels(
+        cls,
+        ticker: str,
+        yes: list[list[int]],
+        no: list[list[int]],
+        timestamp: Optional[int] = None,
+    ) -> "Orderbook":
+        """Build an orderbook from raw API [price, quantity] pairs.
+
+        The whole book is validated in one model_validate call rather
+        than constructing each level separately.
+
+        Args:
+            ticker: Market ticker
+            yes: YES bid levels as [price, quantity]
+            no: NO bid levels as [price, quantity]
+            timestamp: Snapshot time in Unix nanoseconds (defaults to now)
+
+        Returns:
+            Validated orderbook
+        """
+        data: dict = {
+            "ticker": ticker,
+            "yes_bids": [{"price": lv[0], "quantity": lv[1]} for lv in yes],
+            "no_bids": [{"price": lv[0], "quantity": lv[1]} for lv in no],
+        }
+        if timestamp is not None:
+            data["timestamp"] = timestamp
+        return cls.model_validate(data)
+
+    @field_validator("timestamp", mode="before")
+    @classmethod
+    def validate_timestamp(cls, v: Union[int, datetime]) -> int:
+        """Accept a naive UTC datetime for timestamp."""
+        if isinstance(v, datetime):
+            return (v - _EPOCH) // timedelta(microseconds=1) * 1000
+        return v
+
+    @property
+    def timestamp_datetime(self) -> datetime:
+        """Last update time as a naive UTC datetime."""
+        return _EPOCH + timedelta(microseconds=self.timestamp // 1000)
+
+    def invalidate_cache(self) -> None:
+        """Drop memoized best prices after mutating the bid lists in place."""
+        self._top_of_book = None
+
+    def _top(self) -> tuple[int, int, int, int]:
+        """Best price and quantity on each side, computed once per update."""
+        top = self._top_of_book
+        if top is None:
+            top = (
+                *self._best_level(self.yes_bids),
+                *self._best_level(self.no_bids),
+            )
+            self._top_of_book = top
+        return top
 
     @property
     def best_yes_bid(self) -> Optional[int]:
         """Best (highest) YES bid price in cents."""
-        if not self.yes_bids:
-            return None
-        return max(level.price for level in self.yes_bids)
+        return self._top()[0] or None
 
     @property
     def best_no_bid(self) -> Optional[int]:
         """Best (highest) NO bid price in cents."""
-        if not self.no_bids:
-            return None
-        return max(level.price for level in self.no_bids)
+        return self._top()[2] or None
 
     @property
     def best_yes_ask(self) -> Optional[int]:
@@ -91,12 +163,8 @@ class Orderbook(BaseModel):
 
         Implied from NO bids: YES ask at X = NO bid at (100 - X).
         """
-        if not self.no_bids:
-            return None
-        best_no = self.best_no_bid
-        if best_no is None:
-            return None
-        return 100 - best_no
+        best_no = self._top()[2]
+        return 100 - best_no if best_no else None
 
     @property
     def best_no_ask(self) -> Optional[int]:
@@ -104,22 +172,49 @@ class Orderbook(BaseModel):
 
         Implied from YES bids: NO ask at X = YES bid at (100 - X).
         """
-        if not self.yes_bids:
-            return None
-        best_yes = self.best_yes_bid
-        if best_yes is None:
-            return None
-        return 100 - best_yes
+        best_yes = self._top()[0]
+        return 100 - best_yes if best_yes else None
+
+    def best_bid_with_qty(self) -> tuple[Optional[int], int]:
+        """Best YES bid price and the total quantity resting there.
+
+        Returns:
+            Tuple of (best YES bid in cents or None, quantity at that price)
+        """
+        best_yes, quantity = self._top()[:2]
+        return best_yes or None, quantity
+
+    def best_ask_with_qty(self) -> tuple[Optional[int], int]:
+        """Best YES ask price and the total quantity available there.
+
+        Returns:
+            Tuple of (best YES ask in cents or None, quantity at that price)
+        """
+        _, _, best_no, quantity = self._top()
+        return (100 - best_no if best_no else None), quantity
 
     @property
     def yes_ask_quantity(self) -> int:
         """Quantity available at best YES ask."""
-        if not self.no_bids:
-            return 0
-        best_price = self.best_no_bid
-        return sum(
-            level.quantity for level in self.no_bids if level.price == best_price
-        )
+        return self._top()[3]
+
+    @property
+    def yes_bid_quantity(self) -> int:
+        """Quantity available at best YES bid."""
+        return self._top()[1]
+
+    @staticmethod
+    def _best_level(levels: list[OrderbookLevel]) -> tuple[int, int]:
+        """Highest price and total quantity there, found in a single pass."""
+        best_price = 0
+        quantity = 0
+        for level in levels:
+            if level.price > best_price:
+                best_price = level.price
+                quantity = level.quantity
+            elif level.price == best_price:
+                quantity += level.quantity
+        return best_price, quantity
 
     def get_acquisition_cost(self, side: OrderSide, quantity: int = 1) -> Optional[int]:
         """Get cost to acquire contracts in cents.
@@ -142,8 +237,8 @@ class Orderbook(BaseModel):
 class Market(BaseModel):
     """Kalshi market information."""
 
-    ticker: str = Field(..., description="Market ticker")
-    event_ticker: str = Field(..., description="Parent event ticker")
+    ticker: Ticker = Field(..., description="Market ticker")
+    event_ticker: Ticker = Field(..., description="Parent event ticker")
     title: str = Field(default="")
     subtitle: str = Field(default="")
     status: str = Field(default="open")
@@ -226,7 +321,7 @@ class Fill(BaseModel):
 class Position(BaseModel):
     """Portfolio position."""
 
-    ticker: str
+    ticker: Ticker
     market_exposure: int = Field(default=0, description="Exposure in cents")
     position: int = Field(default=0, description="Net contracts (positive=YES)")
     resting_orders_count: int = Field(default=0)
@@ -250,7 +345,7 @@ class Position(BaseModel):
 class ArbitrageLeg(BaseModel):
     """Single leg of an arbitrage trade."""
 
-    ticker: str
+    ticker: Ticker
     side: OrderSide
     action: OrderAction
     price: int = Field(..., ge=1, le=99)
@@ -262,6 +357,24 @@ class ArbitrageLeg(BaseModel):
         return self.price * self.quantity
 
 
+_OPPORTUNITY_IDS = itertools.count()
+
+
+def new_opportunity_id(prefix: str) -> str:
+    """Return an opportunity ID unique across processes.
+
+    The PID is read per call rather than at import, so forked workers
+    (e.g. a ProcessPoolExecutor) never reuse the parent's IDs.
+
+    Args:
+        prefix: Short tag naming the producing strategy
+
+    Returns:
+        ID of the form "<prefix>-<pid>-<counter>" in hex
+    """
+    return f"{prefix}-{os.getpid():x}-{next(_OPPORTUNITY_IDS):x}"
+
+
 class ArbitrageOpportunity(BaseModel):
     """Detected arbitrage opportunity."""
 
@@ -275,9 +388,25 @@ class ArbitrageOpportunity(BaseModel):
     estimated_fees_cents: int = Field(..., description="Estimated trading fees")
     net_profit_cents: int = Field(..., description="Profit after fees")
     max_quantity: int = Field(..., ge=1, description="Max contracts available")
-    detected_at: datetime = Field(default_factory=datetime.utcnow)
+    detected_at: int = Field(
+        default_factory=time.time_ns,
+        description="Detection time in Unix nanoseconds",
+    )
     confidence: float = Field(default=1.0, ge=0, le=1, description="Confidence score")
 
+    @field_validator("detected_at", mode="before")
+    @classmethod
+    def validate_detected_at(cls, v: Union[int, datetime]) -> int:
+        """Accept a naive UTC datetime for detected_at."""
+        if isinstance(v, datetime):
+            return (v - _EPOCH) // timedelta(microseconds=1) * 1000
+        return v
+
+    @property
+    def detected_datetime(self) -> datetime:
+        """Detection time as a naive UTC datetime."""
+        return _EPOCH + timedelta(microseconds=self.detected_at // 1000)
+
     @property
     def profit_margin(self) -> float:
         """Profit margin as percentage."""
@@ -1,8 +1,8 @@
 """Orderbook state management with snapshot and delta support."""
 
 import asyncio
-from datetime import datetime
-from typing import Callable, Optional
+import time
+from typing import Callable, Iterable, Optional
 
 from config.logging_config import get_logger
 from .models import Orderbook, OrderbookLevel, OrderSide
@@ -77,7 +77,8 @@ class OrderbookManager:
             else:
                 self._update_levels(orderbook.no_bids, price, quantity)
 
-            orderbook.timestamp = datetime.utcnow()
+            orderbook.invalidate_cache()
+            orderbook.timestamp = time.time_ns()
             self._notify_subscribers(ticker, orderbook)
 
     def _update_levels(
@@ -131,6 +132,23 @@ class OrderbookManager:
         """Get all current orderbooks."""
         return dict(self._orderbooks)
 
+    def get_orderbooks_for_tickers(
+        self,
+        tickers: Iterable[str],
+    ) -> dict[str, Orderbook]:
+        """Get current orderbooks for the given tickers.
+
+        Tickers without an orderbook are omitted.
+
+        Args:
+            tickers: Market tickers
+
+        Returns:
+            Dict mapping ticker to orderbook
+        """
+        orderbooks = self._orderbooks
+        return {t: orderbooks[t] for t in tickers if t in orderbooks}
+
     def get_best_prices(self, ticker: str) -> dict[str, Optional[int]]:
         """Get best bid/ask prices for a market.
 
@@ -200,10 +218,10 @@ class OrderbookManager:
         Returns:
             Total cost in cents, or None if any market lacks liquidity
         """
-        costs = self.get_acquisition_costs(tickers, side, quantity)
-        if None in costs.values():
+        costs = self.get_acquisition_costs(tickers, side, quantity).values()
+        if None in costs:
             return None
-        return sum(c for c in costs.values() if c is not None)
+        return sum(costs)
 
     def clear(self, ticker: Optional[str] = None) -> None:
         """Clear orderbook data.
@@ -73,7 +73,7 @@ class KalshiWebSocketClient:
             return
 
         # Generate auth headers for WebSocket connection
-        auth_headers = self.authenticator.get_auth_headers("GET", "/ws")
+        auth_headers = await self.authenticator.get_auth_headers_async("GET", "/ws")
 
         try:
             self._ws = await websockets.connect(
@@ -201,18 +201,11 @@ class KalshiWebSocketClient:
         if not ticker:
             return
 
-        from .models import Orderbook, OrderbookLevel
+        from .models import Orderbook
 
-        yes_bids = [
-            OrderbookLevel(price=level[0], quantity=level[1])
-            for level in data.get("yes", [])
-        ]
-        no_bids = [
-            OrderbookLevel(price=level[0], quantity=level[1])
-            for level in data.get("no", [])
-        ]
-
-        orderbook = Orderbook(ticker=ticker, yes_bids=yes_bids, no_bids=no_bids)
+        orderbook = Orderbook.from_levels(
+            ticker, data.get("yes", []), data.get("no", [])
+        )
 
         # Update synchronously (manager handles async internally if needed)
         asyncio.create_task(self.orderbook_manager.update_snapshot(ticker, orderbook))
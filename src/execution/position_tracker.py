@@ -64,6 +64,8 @@ class PositionTracker:
         """
         self.client = client
         self._positions: dict[str, Position] = {}
+        # Sum of market_exposure, maintained whenever positions change
+        self._total_exposure_cents: int = 0
         self._fills: list[Fill] = []
         self._balance_cents: int = 0
         self._last_sync: Optional[datetime] = None
@@ -87,6 +89,9 @@ class PositionTracker:
             )
             self._positions[position.ticker] = position
 
+        self._total_exposure_cents = sum(
+            pos.market_exposure for pos in self._positions.values()
+        )
         self._last_sync = datetime.utcnow()
 
         logger.info(
@@ -266,7 +271,12 @@ class PositionTracker:
         Returns:
             Total exposure in cents
         """
-        return sum(pos.market_exposure for pos in self._positions.values())
+        return self._total_exposure_cents
+
+    @property
+    def total_exposure_cents(self) -> int:
+        """Total exposure across all markets in cents."""
+        return self._total_exposure_cents
 
     @property
     def balance_cents(self) -> int:
@@ -68,6 +68,11 @@ class MetricsCollector:
             ["reason"],
         )
 
+        self.alerts_dropped = Counter(
+            f"{prefix}_alerts_dropped_total",
+            "Total alerts dropped because too many were pending",
+        )
+
         self.api_requests = Counter(
             f"{prefix}_api_requests_total",
             "Total API requests",
@@ -218,6 +223,10 @@ class MetricsCollector:
         """Record a circuit breaker trip."""
         self.circuit_breaker_trips.labels(reason=reason).inc()
 
+    def record_alert_dropped(self) -> None:
+        """Record an alert dropped due to backpressure."""
+        self.alerts_dropped.inc()
+
     # Connection metrics
 
     def update_websocket_status(self, connected: bool) -> None:
@@ -0,0 +1,120 @@
+"""Unit tests for request authentication."""
+
+import base64
+from types import SimpleNamespace
+
+import pytest
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from src.core.authenticator import KalshiAuthenticator, get_authenticator
+
+
+@pytest.fixture
+def private_key():
+    """Create a throwaway RSA key."""
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def authenticator(private_key, tmp_path) -> KalshiAuthenticator:
+    """Create authenticator backed by a temporary key file."""
+    key_path = tmp_path / "key.pem"
+    key_path.write_bytes(
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    authenticator = KalshiAuthenticator("test-key", str(key_path))
+    # Pin the clock so cache-window tests cannot straddle a boundary
+    authenticator._get_timestamp = lambda: 1700000000000
+    return authenticator
+
+
+def _verify(private_key, headers: dict[str, str], suffix: str) -> None:
+    """Verify a signature header against timestamp + suffix."""
+    private_key.public_key().verify(
+        base64.b64decode(headers["KALSHI-ACCESS-SIGNATURE"]),
+        f"{headers['KALSHI-ACCESS-TIMESTAMP']}{suffix}".encode(),
+        padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.MAX_LENGTH,
+        ),
+        hashes.SHA256(),
+    )
+
+
+def test_signature_strips_query_params(authenticator, private_key):
+    """Test the signed payload excludes query parameters."""
+    headers = authenticator.get_auth_headers(
+        "get", "/trade-api/v2/markets?status=open", timestamp=1700000000000
+    )
+
+    assert headers["KALSHI-ACCESS-TIMESTAMP"] == "1700000000000"
+    _verify(private_key, headers, "GET/trade-api/v2/markets")
+
+
+def test_signature_reused_within_window(authenticator, private_key):
+    """Test repeated requests in one window share a valid signature."""
+    first = authenticator.get_auth_headers("GET", "/trade-api/v2/markets?a=1")
+    second = authenticator.get_auth_headers("GET", "/trade-api/v2/markets?b=2")
+    other = authenticator.get_auth_headers("POST", "/trade-api/v2/markets")
+
+    assert first == second
+    assert other["KALSHI-ACCESS-SIGNATURE"] != first["KALSHI-ACCESS-SIGNATURE"]
+    _verify(private_key, second, "GET/trade-api/v2/markets")
+
+
+async def test_async_headers_share_signature_cache(authenticator, private_key):
+    """Test async signing produces valid headers reused by sync callers."""
+    headers = await authenticator.get_auth_headers_async("GET", "/trade-api/v2/events")
+
+    assert authenticator.get_auth_headers("GET", "/trade-api/v2/events") == headers
+    _verify(private_key, headers, "GET/trade-api/v2/events")
+
+
+def test_missing_key_file_raises_value_error(tmp_path):
+    """Test a missing key file raises ValueError chained to the OS error."""
+    with pytest.raises(ValueError, match="Private key file not found") as exc_info:
+        KalshiAuthenticator("test-key", tmp_path / "missing.pem")
+
+    assert isinstance(exc_info.value.__cause__, FileNotFoundError)
+
+
+def test_get_authenticator_shared_per_credentials(private_key, tmp_path):
+    """Test settings with the same credentials share one authenticator."""
+    key_path = tmp_path / "key.pem"
+    key_path.write_bytes(
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    settings = SimpleNamespace(
+        kalshi_api_key_id="test-key", kalshi_private_key_path=key_path
+    )
+    same = SimpleNamespace(
+        kalshi_api_key_id="test-key", kalshi_private_key_path=str(key_path)
+    )
+    other = SimpleNamespace(
+        kalshi_api_key_id="other-key", kalshi_private_key_path=key_path
+    )
+
+    assert get_authenticator(settings) is get_authenticator(same)
+    assert get_authenticator(other) is not get_authenticator(settings)
+
+
+async def test_async_signing_survives_close(authenticator, private_key):
+    """Test pool signing is valid before and after the pool is closed."""
+    headers = await authenticator.get_auth_headers_async("GET", "/trade-api/v2/a")
+    _verify(private_key, headers, "GET/trade-api/v2/a")
+
+    authenticator.close()
+    assert authenticator._sign_pool is None
+
+    headers = await authenticator.get_auth_headers_async("GET", "/trade-api/v2/b")
+    _verify(private_key, headers, "GET/trade-api/v2/b")
+    authenticator.close()
@@ -1,6 +1,7 @@
 """Unit tests for profit calculator."""
 
 import pytest
+from dataclasses import asdict
 from decimal import Decimal
 
 from src.arbitrage.calculator import ProfitCalculator
@@ -100,6 +101,28 @@ class TestProfitCalculator:
         fee = calculator.calculate_fee_per_contract(price=1)
         assert fee == 1
 
+    def test_fee_rounding_matches_decimal(self):
+        """Test integer fee math rounds up exactly like Decimal ROUND_UP."""
+        from decimal import ROUND_UP
+
+        for rate in (Decimal("0.007"), Decimal("0.01"), Decimal("0.035")):
+            calculator = ProfitCalculator(fee_rate=rate)
+            for price in range(1, 100):
+                for quantity in (1, 7, 250):
+                    expected = int(
+                        (Decimal(100 - price) * rate * quantity).quantize(
+                            Decimal("1"), rounding=ROUND_UP
+                        )
+                    )
+                    leg = ArbitrageLeg(
+                        ticker="A",
+                        side=OrderSide.YES,
+                        action=OrderAction.BUY,
+                        price=price,
+                        quantity=quantity,
+                    )
+                    assert calculator.calculate_total_fees([leg]) == expected
+
     def test_calculate_total_fees(
         self,
         calculator: ProfitCalculator,
@@ -115,6 +138,18 @@ class TestProfitCalculator:
         fees = calculator.calculate_total_fees(three_leg_arb)
         assert fees == 1
 
+    def test_fees_for_prices_matches_legs(
+        self,
+        calculator: ProfitCalculator,
+        three_leg_arb: list[ArbitrageLeg],
+    ):
+        """Test price-only fee calculation agrees with leg-based fees."""
+        prices = [leg.price for leg in three_leg_arb]
+        assert calculator.calculate_fees_for_prices(prices) == (
+            calculator.calculate_total_fees(three_leg_arb)
+        )
+        assert calculator.calculate_fees_for_prices([]) == 0
+
     def test_calculate_net_profit(
         self,
         calculator: ProfitCalculator,
@@ -136,6 +171,15 @@ class TestProfitCalculator:
         assert calculator.is_profitable(three_leg_arb, min_profit_cents=4)
         assert not calculator.is_profitable(three_leg_arb, min_profit_cents=5)
 
+    def test_compute_profitability(
+        self,
+        calculator: ProfitCalculator,
+        three_leg_arb: list[ArbitrageLeg],
+    ):
+        """Test combined net profit and profitability check."""
+        assert calculator.compute_profitability(three_leg_arb, 4) == (4, True)
+        assert calculator.compute_profitability(three_leg_arb, 5) == (4, False)
+
     def test_profit_summary(
         self,
         calculator: ProfitCalculator,
@@ -152,6 +196,18 @@ class TestProfitCalculator:
         assert summary["is_profitable"]
         assert summary["profit_margin_pct"] == pytest.approx(4.21, rel=0.01)
 
+    def test_profit_summary_obj_matches_dict(
+        self,
+        calculator: ProfitCalculator,
+        three_leg_arb: list[ArbitrageLeg],
+    ):
+        """Test summary object carries the same metrics as the dict form."""
+        summary = calculator.profit_summary_obj(three_leg_arb)
+
+        assert summary.net_profit_cents == 4
+        assert summary.is_profitable
+        assert asdict(summary) == calculator.profit_summary(three_leg_arb)
+
     def test_no_profit_scenario(self, calculator: ProfitCalculator):
         """Test when there's no profit."""
         legs = [
@@ -0,0 +1,70 @@
+"""Unit tests for the Kalshi HTTP client."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.client import KalshiClient
+
+
+@pytest.fixture
+def client() -> KalshiClient:
+    """Create a client with mocked auth and rate limiting."""
+    authenticator = MagicMock()
+    authenticator.get_auth_headers_async = AsyncMock(return_value={})
+    rate_limiter = MagicMock()
+    rate_limiter.get_limiter.return_value.acquire = AsyncMock()
+    return KalshiClient(
+        "https://example.test/trade-api/v2",
+        authenticator,
+        rate_limiter=rate_limiter,
+        max_concurrent_requests=3,
+    )
+
+
+async def test_in_flight_requests_capped(client):
+    """Test concurrent requests never exceed the semaphore limit."""
+    in_flight = 0
+    peak = 0
+
+    @asynccontextmanager
+    async def request(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            yield MagicMock()
+        finally:
+            in_flight -= 1
+
+    client._get_session = AsyncMock(return_value=MagicMock(request=request))
+    client._handle_response = AsyncMock(return_value={})
+
+    await asyncio.gather(*(client._request("GET", "/markets") for _ in range(10)))
+
+    assert peak == 3
+    assert client._handle_response.await_count == 10
+
+
+def test_backoff_delay_full_jitter(client, monkeypatch):
+    """Test backoff is uniform from zero up to the capped exponential."""
+    calls = []
+    monkeypatch.setattr(
+        "src.core.client.random.uniform", lambda a, b: calls.append((a, b)) or b
+    )
+
+    assert client._backoff_delay(0) == 1.0
+    assert client._backoff_delay(3) == 8.0
+    assert client._backoff_delay(10) == client.BACKOFF_MAX
+    assert calls == [(0, 1.0), (0, 8.0), (0, client.BACKOFF_MAX)]
+
+
+def test_backoff_delay_within_bounds(client):
+    """Test jittered delays stay inside [0, cap] and are not constant."""
+    delays = {client._backoff_delay(2) for _ in range(50)}
+
+    assert all(0 <= d <= 4.0 for d in delays)
+    assert len(delays) > 1
@@ -0,0 +1,128 @@
+"""Unit tests for correlated events arbitrage strategy."""
+
+import pytest
+
+from src.arbitrage.detector import ArbitrageDetector
+from src.arbitrage.strategies.correlated import (
+    CorrelatedStrategy,
+    CorrelationRule,
+    CorrelationType,
+)
+from src.data.models import Market, Orderbook, OrderbookLevel
+
+RULES = [
+    CorrelationRule(
+        market_a_pattern="*-CANDA-*",
+        market_b_pattern="*-CANDB-*",
+        correlation=CorrelationType.EXCLUDES,
+        description="Only one candidate can win",
+    ),
+    CorrelationRule(
+        market_a_pattern="*-CHAMP-*",
+        market_b_pattern="*-PLAYOFF-*",
+        correlation=CorrelationType.IMPLIES,
+        description="Champion must make playoffs",
+    ),
+]
+
+
+@pytest.fixture
+def strategy():
+    """Create strategy instance with test rules."""
+    return CorrelatedStrategy(min_profit_cents=1, rules=RULES)
+
+
+def _market(ticker: str) -> Market:
+    """Market whose event ticker is the ticker's first segment."""
+    return Market(ticker=ticker, event_ticker=ticker.split("-")[0])
+
+
+def _book(ticker: str, yes_bid: int, yes_ask: int) -> Orderbook:
+    """Orderbook with one YES bid and an implied YES ask."""
+    return Orderbook(
+        ticker=ticker,
+        yes_bids=[OrderbookLevel(price=yes_bid, quantity=50)],
+        no_bids=[OrderbookLevel(price=100 - yes_ask, quantity=50)],
+    )
+
+
+class TestCorrelatedStrategy:
+    """Tests for CorrelatedStrategy."""
+
+    def test_scan_excludes_filters_pairs(self, strategy: CorrelatedStrategy):
+        """Test only pairs whose asks sum below 100 are reported."""
+        cheap = (_market("PRES-CANDA-24"), _market("PRES-CANDB-24"))
+        fair = (_market("GOV-CANDA-24"), _market("GOV-CANDB-24"))
+        orderbooks = {
+            "PRES-CANDA-24": _book("PRES-CANDA-24", 38, 40),
+            "PRES-CANDB-24": _book("PRES-CANDB-24", 43, 45),
+            "GOV-CANDA-24": _book("GOV-CANDA-24", 48, 50),
+            "GOV-CANDB-24": _book("GOV-CANDB-24", 49, 51),
+        }
+
+        opportunities = strategy.scan_excludes([cheap, fair], orderbooks)
+
+        assert len(opportunities) == 1
+        assert opportunities[0].event_ticker == "PRES+PRES"
+        assert opportunities[0].total_cost_cents == 85
+
+    def test_scan_excludes_skips_missing_orderbooks(
+        self, strategy: CorrelatedStrategy
+    ):
+        """Test pairs without both orderbooks are skipped."""
+        pair = (_market("PRES-CANDA-24"), _market("PRES-CANDB-24"))
+        orderbooks = {"PRES-CANDA-24": _book("PRES-CANDA-24", 38, 40)}
+
+        assert strategy.scan_excludes([pair], orderbooks) == []
+
+    def test_scan_implies_filters_pairs(self, strategy: CorrelatedStrategy):
+        """Test only pairs whose antecedent bid exceeds the consequent ask."""
+        violated = (_market("NBA-CHAMP-BOS"), _market("NBA-PLAYOFF-BOS"))
+        consistent = (_market("NBA-CHAMP-NYK"), _market("NBA-PLAYOFF-NYK"))
+        orderbooks = {
+            "NBA-CHAMP-BOS": _book("NBA-CHAMP-BOS", 60, 62),
+            "NBA-PLAYOFF-BOS": _book("NBA-PLAYOFF-BOS", 48, 50),
+            "NBA-CHAMP-NYK": _book("NBA-CHAMP-NYK", 20, 22),
+            "NBA-PLAYOFF-NYK": _book("NBA-PLAYOFF-NYK", 48, 50),
+        }
+
+        opportunities = strategy.scan_implies([violated, consistent], orderbooks)
+
+        assert len(opportunities) == 1
+        assert {leg.ticker for leg in opportunities[0].legs} == {
+            "NBA-CHAMP-BOS",
+            "NBA-PLAYOFF-BOS",
+        }
+
+
+class TestDetectorMarketPairs:
+    """Tests for correlated pair scanning through the detector."""
+
+    def test_scan_market_pairs_routes_by_rule(self, strategy: CorrelatedStrategy):
+        """Test matched pairs are scanned and unmatched pairs ignored."""
+        detector = ArbitrageDetector(min_profit_cents=1)
+        detector.strategies["correlated"] = strategy
+        excludes = (_market("PRES-CANDA-24"), _market("PRES-CANDB-24"))
+        implies = (_market("NBA-CHAMP-BOS"), _market("NBA-PLAYOFF-BOS"))
+        unmatched = (_market("PRES-CANDA-24"), _market("OTHER-X"))
+        orderbooks = {
+            "PRES-CANDA-24": _book("PRES-CANDA-24", 38, 40),
+            "PRES-CANDB-24": _book("PRES-CANDB-24", 43, 45),
+            "NBA-CHAMP-BOS": _book("NBA-CHAMP-BOS", 60, 62),
+            "NBA-PLAYOFF-BOS": _book("NBA-PLAYOFF-BOS", 48, 50),
+            "OTHER-X": _book("OTHER-X", 5, 10),
+        }
+
+        opportunities = detector.scan_market_pairs(
+            [excludes, implies, unmatched], orderbooks
+        )
+
+        assert sorted(o.event_ticker for o in opportunities) == [
+            "NBA+NBA",
+            "PRES+PRES",
+        ]
+
+        single = detector.scan_market_pair(
+            *excludes, orderbooks["PRES-CANDA-24"], orderbooks["PRES-CANDB-24"]
+        )
+        assert [o.total_cost_cents for o in single] == [85]
@@ -0,0 +1,166 @@
+"""Unit tests for bot engine scan/execution hand-off."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.bot.engine import ArbitrageBotEngine
+
+
+@pytest.fixture
+def engine():
+    """Create an engine with mocked collaborators (skips full wiring)."""
+    engine = ArbitrageBotEngine.__new__(ArbitrageBotEngine)
+    engine._running = True
+    engine._opportunities = asyncio.Queue()
+    engine._queued_events = set()
+    engine._rescan_events = set()
+    engine._pending_events = set()
+    engine._dirty_events = asyncio.Queue()
+    engine._ticker_to_event = {"EVENT-A": "EVENT"}
+    engine._watched_events = {"EVENT"}
+    engine._alert_tasks = set()
+
+    engine.market_fetcher = MagicMock()
+    engine.market_fetcher.get_markets_for_event_nowait.return_value = [
+        MagicMock(ticker="EVENT-A")
+    ]
+    engine.orderbook_manager = MagicMock()
+    engine.orderbook_manager.get_orderbooks_for_tickers.return_value = {
+        "EVENT-A": MagicMock()
+    }
+    engine.detector = MagicMock()
+    engine.detector.scan_event.return_value = [
+        MagicMock(event_ticker="EVENT", max_quantity=1, total_cost_cents=95)
+    ]
+    engine.detector.get_best_opportunity.side_effect = lambda opps: (
+        opps[0] if opps else None
+    )
+
+    engine.metrics = MagicMock()
+    engine.circuit_breaker = AsyncMock()
+    engine.exposure_manager = AsyncMock()
+    engine.exposure_manager.check_trade.return_value = MagicMock(
+        allowed=True, max_allowed_quantity=10
+    )
+    engine.position_tracker = MagicMock(total_exposure_cents=0)
+    engine.executor = AsyncMock()
+    return engine
+
+
+async def test_rescans_during_execution_do_not_requeue(engine):
+    """Test an event's opportunity is executed once while it is in flight."""
+    release = asyncio.Event()
+
+    async def execute(opportunity, quantity):
+        await release.wait()
+        return MagicMock(success=True, profit_cents=5)
+
+    engine.executor.execute.side_effect = execute
+    worker = asyncio.create_task(engine._execution_loop())
+
+    await engine._scan_event("EVENT")
+    await asyncio.sleep(0)  # Worker picks up the opportunity and blocks
+    await engine._scan_event("EVENT")
+    await engine._scan_event("EVENT")
+
+    release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert engine.executor.execute.await_count == 1
+    assert engine._opportunities.empty()
+    assert "EVENT" not in engine._queued_events
+    # The skipped rescans leave exactly one follow-up scan queued
+    assert engine._dirty_events.qsize() == 1
+    assert engine._dirty_events.get_nowait() == "EVENT"
+    engine._pending_events.clear()
+
+    # Once handled, the next scan may queue the event again
+    await engine._scan_event("EVENT")
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert engine.executor.execute.await_count == 2
+
+    engine._running = False
+    engine._opportunities.put_nowait(None)
+    await worker
+
+
+async def test_queues_best_opportunity(engine):
+    """Test the detector's best opportunity is queued, not the first."""
+    first, best = MagicMock(), MagicMock()
+    engine.detector.scan_event.return_value = [first, best]
+    engine.detector.get_best_opportunity.side_effect = None
+    engine.detector.get_best_opportunity.return_value = best
+
+    await engine._scan_event("EVENT")
+
+    assert engine._opportunities.get_nowait() == ("EVENT", best)
+
+
+async def test_no_profitable_opportunity_queues_nothing(engine):
+    """Test nothing is queued when the detector finds no best opportunity."""
+    engine.detector.get_best_opportunity.side_effect = None
+    engine.detector.get_best_opportunity.return_value = None
+
+    await engine._scan_event("EVENT")
+
+    assert engine._opportunities.empty()
+    assert "EVENT" not in engine._queued_events
+
+
+def test_orderbook_updates_dedupe_pending_events(engine):
+    """Test repeated updates for one event queue a single scan."""
+    engine._on_orderbook_update("EVENT-A", MagicMock())
+    engine._on_orderbook_update("EVENT-A", MagicMock())
+    engine._on_orderbook_update("UNKNOWN", MagicMock())
+
+    assert engine._pending_events == {"EVENT"}
+    assert engine._dirty_events.qsize() == 1
+
+
+async def test_scan_loop_coalesces_updates_and_stops_on_sentinel(engine):
+    """Test a burst of updates is scanned once and None ends the loop."""
+    engine._scan_event = AsyncMock()
+    for _ in range(3):
+        engine._on_orderbook_update("EVENT-A", MagicMock())
+
+    loop = asyncio.create_task(engine._scan_loop())
+    await asyncio.sleep(0)
+
+    engine._scan_event.assert_awaited_once_with("EVENT")
+    assert not engine._pending_events
+
+    # Once scanned, a new update queues another scan
+    engine._on_orderbook_update("EVENT-A", MagicMock())
+    await asyncio.sleep(0)
+    assert engine._scan_event.await_count == 2
+
+    engine._running = False
+    engine._dirty_events.put_nowait(None)
+    await asyncio.wait_for(loop, timeout=1)
+
+
+async def test_alerts_beyond_cap_are_dropped(engine):
+    """Test alerts over MAX_PENDING_ALERTS are closed and counted."""
+    engine.MAX_PENDING_ALERTS = 2
+    release = asyncio.Event()
+
+    async def alert():
+        await release.wait()
+
+    dropped = alert()
+    engine._spawn_alert(alert())
+    engine._spawn_alert(alert())
+    engine._spawn_alert(dropped)
+
+    assert len(engine._alert_tasks) == 2
+    assert dropped.cr_frame is None  # Closed without running
+    engine.metrics.record_alert_dropped.assert_called_once()
+
+    release.set()
+    await asyncio.gather(*engine._alert_tasks)
+    await asyncio.sleep(0)
+    assert not engine._alert_tasks
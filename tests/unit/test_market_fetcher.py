@@ -0,0 +1,118 @@
+"""Unit tests for market fetcher caching."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.data.market_fetcher import MarketFetcher
+
+
+@pytest.fixture
+def client():
+    """Create mock client returning one market per event."""
+    client = MagicMock()
+    client.get_markets = AsyncMock(
+        return_value={"markets": [{"ticker": "EVENT-A", "event_ticker": "EVENT"}]}
+    )
+    return client
+
+
+async def test_nowait_returns_immediately_and_refreshes(client):
+    """Test a cold event returns empty and is fetched in the background."""
+    fetcher = MarketFetcher(client)
+
+    assert fetcher.get_markets_for_event_nowait("EVENT") == []
+    # A second call while the refresh is running does not start another
+    assert fetcher.get_markets_for_event_nowait("EVENT") == []
+    await asyncio.gather(*fetcher._event_refreshes.values())
+
+    markets = fetcher.get_markets_for_event_nowait("EVENT")
+
+    assert [m.ticker for m in markets] == ["EVENT-A"]
+    assert client.get_markets.await_count == 1
+
+
+async def test_nowait_skips_fresh_and_negative_entries(client):
+    """Test fresh entries, including empty ones, are not refetched."""
+    client.get_markets.return_value = {"markets": []}
+    fetcher = MarketFetcher(client)
+    await fetcher.get_markets_by_event("EVENT")
+
+    assert fetcher.get_markets_for_event_nowait("EVENT") == []
+    await asyncio.sleep(0)
+
+    assert client.get_markets.await_count == 1
+
+
+async def test_orderbooks_for_event_skips_failures(client):
+    """Test orderbooks are fetched per market and failures are dropped."""
+    client.get_markets.return_value = {
+        "markets": [
+            {"ticker": "EVENT-A", "event_ticker": "EVENT"},
+            {"ticker": "EVENT-B", "event_ticker": "EVENT"},
+        ]
+    }
+
+    async def get_orderbook(ticker, depth):
+        if ticker == "EVENT-B":
+            raise RuntimeError("boom")
+        return {"orderbook": {"no": [[55, 10]]}}
+
+    client.get_orderbook = AsyncMock(side_effect=get_orderbook)
+    fetcher = MarketFetcher(client)
+
+    orderbooks = await fetcher.get_orderbooks_for_event("EVENT")
+
+    assert list(orderbooks) == ["EVENT-A"]
+    assert orderbooks["EVENT-A"].best_yes_ask == 45
+
+
+async def test_concurrent_orderbook_requests_coalesce(client):
+    """Test simultaneous fetches of one ticker share a single request."""
+    client.get_orderbook = AsyncMock(return_value={"orderbook": {"yes": [[40, 5]]}})
+    fetcher = MarketFetcher(client)
+
+    first, second = await asyncio.gather(
+        fetcher.get_orderbook("EVENT-A"),
+        fetcher.get_orderbook("EVENT-A"),
+    )
+
+    assert first is second
+    assert client.get_orderbook.await_count == 1
+
+    await fetcher.get_orderbook("EVENT-A")
+    assert client.get_orderbook.await_count == 2
+
+
+async def test_markets_by_event_follows_cursor(client):
+    """Test paginated market listings are fetched until the cursor ends."""
+    client.get_markets.side_effect = [
+        {"markets": [{"ticker": "EVENT-A", "event_ticker": "EVENT"}], "cursor": "p2"},
+        {"markets": [{"ticker": "EVENT-B", "event_ticker": "EVENT"}]},
+    ]
+    fetcher = MarketFetcher(client)
+
+    markets = await fetcher.get_markets_by_event("EVENT")
+
+    assert [m.ticker for m in markets] == ["EVENT-A", "EVENT-B"]
+    assert client.get_markets.call_args.kwargs["cursor"] == "p2"
+
+
+async def test_market_cache_evicts_least_recently_used(client):
+    """Test the market cache stays within its bound."""
+    client.get_market = AsyncMock(
+        side_effect=lambda ticker: {"market": {"ticker": ticker}}
+    )
+    fetcher = MarketFetcher(client)
+    fetcher.MARKET_CACHE_SIZE = 2
+
+    await fetcher.get_market("A")
+    await fetcher.get_market("B")
+    await fetcher.get_market("A")  # Refresh A so B is the oldest
+    await fetcher.get_market("C")
+    await fetcher.get_market("A")
+
+    assert client.get_market.await_count == 3
+    await fetcher.get_market("B")
+    assert client.get_market.await_count == 4
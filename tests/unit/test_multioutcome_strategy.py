@@ -1,6 +1,8 @@
 """Unit tests for multi-outcome arbitrage strategy."""
 
+import multiprocessing
 import pytest
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 from src.arbitrage.strategies.multioutcome import MultiOutcomeStrategy
@@ -255,3 +257,24 @@ class TestMultiOutcomeStrategy:
         assert opportunity is not None
         assert opportunity.total_cost_cents == 93
         assert opportunity.gross_profit_cents == 7
+
+    def test_process_pool_ids_unique(
+        self,
+        strategy: MultiOutcomeStrategy,
+        three_outcome_markets: list[Market],
+        profitable_orderbooks: dict[str, Orderbook],
+    ):
+        """Test forked workers do not hand out duplicate opportunity IDs."""
+        with ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context("fork")
+        ) as executor:
+            opportunities = list(
+                executor.map(
+                    strategy.detect,
+                    [three_outcome_markets] * 4,
+                    [profitable_orderbooks] * 4,
+                )
+            )
+
+        assert len(opportunities) == 4
+        assert len({o.id for o in opportunities}) == 4
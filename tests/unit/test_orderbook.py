@@ -0,0 +1,114 @@
+"""Unit tests for orderbook model and manager."""
+
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from src.data.models import Orderbook, OrderbookLevel, OrderSide
+from src.data.orderbook_manager import OrderbookManager
+
+
+def test_best_prices_and_quantities():
+    """Test best levels are derived from the bid lists."""
+    orderbook = Orderbook(
+        ticker="TEST",
+        yes_bids=[
+            OrderbookLevel(price=40, quantity=10),
+            OrderbookLevel(price=42, quantity=5),
+        ],
+        no_bids=[OrderbookLevel(price=55, quantity=20)],
+    )
+
+    assert orderbook.best_yes_bid == 42
+    assert orderbook.yes_bid_quantity == 5
+    assert orderbook.best_yes_ask == 45
+    assert orderbook.yes_ask_quantity == 20
+    assert orderbook.best_no_ask == 58
+
+
+def test_empty_sides():
+    """Test empty bid lists give no prices and zero quantity."""
+    orderbook = Orderbook(ticker="TEST")
+
+    assert orderbook.best_yes_bid is None
+    assert orderbook.best_yes_ask is None
+    assert orderbook.yes_ask_quantity == 0
+
+
+async def test_delta_refreshes_cached_prices():
+    """Test applying a delta is reflected in memoized best prices."""
+    manager = OrderbookManager()
+    orderbook = Orderbook(
+        ticker="TEST",
+        no_bids=[OrderbookLevel(price=55, quantity=20)],
+    )
+    await manager.update_snapshot("TEST", orderbook)
+    assert orderbook.best_yes_ask == 45
+
+    await manager.apply_delta("TEST", OrderSide.NO, price=60, quantity=7)
+    assert orderbook.best_yes_ask == 40
+    assert orderbook.yes_ask_quantity == 7
+
+    await manager.apply_delta("TEST", OrderSide.NO, price=60, quantity=0)
+    assert orderbook.best_yes_ask == 45
+
+
+def test_best_bid_with_qty_sums_ties():
+    """Test quantities at the best bid are summed across levels."""
+    orderbook = Orderbook(
+        ticker="TEST",
+        yes_bids=[
+            OrderbookLevel(price=42, quantity=5),
+            OrderbookLevel(price=40, quantity=10),
+            OrderbookLevel(price=42, quantity=3),
+        ],
+    )
+
+    assert orderbook.best_bid_with_qty() == (42, 8)
+    assert Orderbook(ticker="EMPTY").best_bid_with_qty() == (None, 0)
+
+
+def test_best_ask_with_qty_implied_from_no_bids():
+    """Test best YES ask and its quantity come from the best NO bid."""
+    orderbook = Orderbook(
+        ticker="TEST",
+        no_bids=[
+            OrderbookLevel(price=55, quantity=20),
+            OrderbookLevel(price=58, quantity=4),
+        ],
+    )
+
+    assert orderbook.best_ask_with_qty() == (42, 4)
+    assert Orderbook(ticker="EMPTY").best_ask_with_qty() == (None, 0)
+
+
+async def test_get_orderbooks_for_tickers():
+    """Test lookup returns only the requested tickers that have books."""
+    manager = OrderbookManager()
+    await manager.update_snapshot("A", Orderbook(ticker="A"))
+    await manager.update_snapshot("B", Orderbook(ticker="B"))
+
+    orderbooks = manager.get_orderbooks_for_tickers(["A", "MISSING"])
+
+    assert list(orderbooks) == ["A"]
+    assert orderbooks["A"] is manager.get_orderbook("A")
+
+
+def test_from_levels_validates_raw_pairs():
+    """Test raw [price, quantity] pairs build a validated orderbook."""
+    orderbook = Orderbook.from_levels("TEST", [[40, 10], [42, 5]], [[55, 20]])
+
+    assert orderbook.yes_bids[1] == OrderbookLevel(price=42, quantity=5)
+    assert orderbook.best_yes_ask == 45
+
+    with pytest.raises(ValidationError):
+        Orderbook.from_levels("TEST", [[100, 1]], [])
+
+
+def test_timestamp_accepts_datetime():
+    """Test a datetime timestamp is stored as Unix nanoseconds."""
+    orderbook = Orderbook(ticker="TEST", timestamp=datetime(2024, 1, 1))
+
+    assert orderbook.timestamp == 1704067200 * 10**9
+    assert orderbook.timestamp_datetime == datetime(2024, 1, 1)
@@ -0,0 +1,37 @@
+"""Unit tests for token bucket rate limiter."""
+
+import asyncio
+
+import pytest
+
+from src.core.rate_limiter import DualRateLimiter, RateLimiter
+
+
+async def test_acquire_within_bucket_does_not_wait():
+    """Test tokens in the bucket are granted immediately."""
+    limiter = RateLimiter(tokens_per_second=10, bucket_size=2)
+
+    assert await limiter.acquire() == 0.0
+    assert await limiter.acquire() == 0.0
+    assert limiter.available_tokens < 1
+
+
+async def test_concurrent_waiters_get_staggered_slots():
+    """Test waiters past the bucket are spaced one refill interval apart."""
+    limiter = RateLimiter(tokens_per_second=100, bucket_size=1)
+
+    waits = await asyncio.gather(*(limiter.acquire() for _ in range(3)))
+
+    assert waits[0] == 0.0
+    assert waits[1] == pytest.approx(0.01, abs=0.005)
+    assert waits[2] == pytest.approx(0.02, abs=0.005)
+
+
+def test_get_limiter_routes_reads_and_writes():
+    """Test read methods use the read limiter and others the write limiter."""
+    limiters = DualRateLimiter()
+
+    assert limiters.get_limiter("GET") is limiters.read_limiter
+    assert limiters.get_limiter("head") is limiters.read_limiter
+    assert limiters.get_limiter("POST") is limiters.write_limiter
+    assert limiters.get_limiter("delete") is limiters.write_limiter
@@ -0,0 +1,88 @@
+"""Unit tests for time-based arbitrage strategy."""
+
+import pytest
+from datetime import datetime
+
+from src.arbitrage.strategies.time_based import TimeBasedStrategy
+from src.data.models import Market, Orderbook, OrderbookLevel
+
+
+@pytest.fixture
+def strategy():
+    """Create strategy instance."""
+    return TimeBasedStrategy(min_profit_cents=1, min_price_diff=3)
+
+
+@pytest.fixture
+def quarterly_markets():
+    """Create three markets on one underlying with increasing expirations."""
+    return [
+        Market(
+            ticker=f"BTC-Q{q}",
+            event_ticker="BTC",
+            expiration_time=datetime(2025, 3 * q, 28),
+        )
+        for q in (1, 2, 3)
+    ]
+
+
+def _book(ticker: str, yes_bid: int, yes_ask: int) -> Orderbook:
+    """Orderbook with one YES bid and an implied YES ask."""
+    return Orderbook(
+        ticker=ticker,
+        yes_bids=[OrderbookLevel(price=yes_bid, quantity=50)],
+        no_bids=[OrderbookLevel(price=100 - yes_ask, quantity=50)],
+    )
+
+
+class TestTimeBasedStrategy:
+    """Tests for TimeBasedStrategy."""
+
+    def test_temporal_pairs_are_consecutive(
+        self,
+        strategy: TimeBasedStrategy,
+        quarterly_markets: list[Market],
+    ):
+        """Test consecutive expiration pairing."""
+        pairs = strategy.find_temporal_pairs(list(reversed(quarterly_markets)))
+
+        assert [(a.ticker, b.ticker) for a, b in pairs] == [
+            ("BTC-Q1", "BTC-Q2"),
+            ("BTC-Q2", "BTC-Q3"),
+        ]
+
+    def test_arbitrage_pairs_skip_expirations(
+        self,
+        strategy: TimeBasedStrategy,
+        quarterly_markets: list[Market],
+    ):
+        """Test a mispricing against a non-adjacent expiration is found."""
+        orderbooks = {
+            "BTC-Q1": _book("BTC-Q1", yes_bid=60, yes_ask=62),
+            "BTC-Q2": _book("BTC-Q2", yes_bid=63, yes_ask=65),  # No Q1 arb
+            "BTC-Q3": _book("BTC-Q3", yes_bid=52, yes_ask=55),
+        }
+
+        pairs = strategy.find_arbitrage_pairs(quarterly_markets, orderbooks)
+
+        assert [(a.ticker, b.ticker) for a, b in pairs] == [
+            ("BTC-Q1", "BTC-Q3"),
+            ("BTC-Q2", "BTC-Q3"),
+        ]
+
+    def test_arbitrage_pairs_require_later_expiration(
+        self,
+        strategy: TimeBasedStrategy,
+    ):
+        """Test markets sharing an expiration are never paired."""
+        expiry = datetime(2025, 6, 30)
+        markets = [
+            Market(ticker="A", event_ticker="E", expiration_time=expiry),
+            Market(ticker="B", event_ticker="E", expiration_time=expiry),
+        ]
+        orderbooks = {
+            "A": _book("A", yes_bid=70, yes_ask=72),
+            "B": _book("B", yes_bid=40, yes_ask=45),
+        }
+
+        assert strategy.find_arbitrage_pairs(markets, orderbooks) == []